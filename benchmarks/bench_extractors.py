@@ -0,0 +1,60 @@
+"""Micro-benchmark of the HTML extractor backends on the stored FT fixtures.
+
+Usage:
+    python -m benchmarks.bench_extractors [--rounds 200]
+"""
+import argparse
+import json
+import time
+from pathlib import Path
+
+from src.scrap.extractors import EXTRACTORS
+
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+
+
+def bench(func, html, rounds):
+    best = float("inf")
+    total = 0.0
+
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func(html)
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        total += elapsed
+
+    return {"mean_ms": total / rounds * 1000, "best_ms": best * 1000}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    article = (FIXTURES / "ft_article.html").read_text()
+    listing = (FIXTURES / "ft_listing.html").read_text()
+
+    reference = None
+    results = {}
+
+    for name, extractor_cls in EXTRACTORS.items():
+        extractor = extractor_cls()
+        output = (extractor.extract_article(article), extractor.extract_listing(listing))
+
+        if reference is None:
+            reference = output
+        elif output != reference:
+            raise SystemExit(f"{name} output differs from {next(iter(EXTRACTORS))}")
+
+        results[name] = {
+            "article": bench(extractor.extract_article, article, args.rounds),
+            "listing": bench(extractor.extract_listing, listing, args.rounds),
+        }
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import os
+import json
+import platform
+from datetime import datetime
+
+import pytest
+
+from benchmarks.fake_ft import FakeFT
+
+
+BENCH_OUTPUT = os.getenv("BENCH_OUTPUT", "bench_output.json")
+
+
+def _env_int(name, default):
+    return int(os.getenv(name, default))
+
+
+@pytest.fixture(scope="session")
+def bench_results():
+    results = {
+        "started_at": datetime.utcnow().isoformat(),
+        "python": platform.python_version(),
+        "config": {
+            "pages": _env_int("BENCH_PAGES", 5),
+            "articles_per_page": _env_int("BENCH_ARTICLES_PER_PAGE", 25),
+            "paragraphs": _env_int("BENCH_ARTICLE_PARAGRAPHS", 25),
+            "latency_ms": _env_int("BENCH_LATENCY_MS", 20),
+            "concurrency": _env_int("BENCH_CONCURRENCY", 10),
+        },
+        "results": {},
+    }
+
+    yield results
+
+    with open(BENCH_OUTPUT, "w") as f:
+        json.dump(results, f, indent=2)
+
+
+@pytest.fixture
+def fake_ft(bench_results):
+    config = bench_results["config"]
+
+    return FakeFT(
+        pages=config["pages"],
+        articles_per_page=config["articles_per_page"],
+        paragraphs=config["paragraphs"],
+        latency=config["latency_ms"] / 1000,
+    )
@@ -0,0 +1,99 @@
+"""A local stand-in for ft.com serving generated listing and article pages."""
+import asyncio
+import random
+from datetime import datetime, timedelta
+
+import httpx
+
+
+WORDS = ("markets inflation central bank rates growth trade tariffs energy policy "
+         "investors bonds equities europe china election budget deficit currency").split()
+
+
+def _sentence(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(n)).capitalize() + "."
+
+
+class FakeFT:
+    """Generates FT-shaped pages on the fly and serves them through an httpx transport.
+
+    The listing at `/world` has `pages` pages of `articles_per_page` teasers, newest
+    first, one minute apart. Every article has `paragraphs` paragraphs of text and
+    every response is delayed by `latency` seconds.
+    """
+    def __init__(self, pages: int = 5, articles_per_page: int = 25, paragraphs: int = 25, latency: float = 0.02):
+        self.pages = pages
+        self.articles_per_page = articles_per_page
+        self.paragraphs = paragraphs
+        self.latency = latency
+        self.now = datetime.utcnow()
+        self.requests = 0
+        self.bytes_sent = 0
+
+    @property
+    def total_articles(self) -> int:
+        return self.pages * self.articles_per_page
+
+    def published_at(self, article_id: int) -> datetime:
+        return self.now - timedelta(minutes=article_id + 1)
+
+    def listing_page(self, page: int) -> str:
+        rng = random.Random(page)
+        first = (page - 1) * self.articles_per_page
+        teasers = "\n".join(f'''
+            <li class="o-teaser-collection__item o-grid-row">
+                <div class="o-teaser" data-id="{i}">
+                    <div class="o-teaser__meta"><a class="o-teaser__tag" href="/tag-{i}">{rng.choice(WORDS).title()}</a></div>
+                    <div class="o-teaser__heading"><a data-trackable="heading-link" href="/content/{i}">{_sentence(rng, 8)}</a></div>
+                    <p class="o-teaser__standfirst">{_sentence(rng, 20)}</p>
+                    <time class="o3-type-label o-date" datetime="{self.published_at(i).strftime('%Y-%m-%dT%H:%M:%S')}.000Z"></time>
+                </div>
+            </li>''' for i in range(first, first + self.articles_per_page))
+        next_link = f'<a data-trackable="next-page" href="?page={page + 1}">Next</a>' if page < self.pages else ""
+
+        return f'''<html><head><title>World | Financial Times</title></head><body>
+            <nav>{"".join(f'<a href="/section-{i}">Section {i}</a>' for i in range(60))}</nav>
+            <ul>{teasers}</ul>
+            <div class="stream__pagination">{next_link}</div>
+            <footer>{"".join(f'<a href="/footer-{i}">Footer {i}</a>' for i in range(80))}</footer>
+        </body></html>'''
+
+    def article_page(self, article_id: int) -> str:
+        rng = random.Random(article_id)
+        paragraphs = "\n".join(f"<p>{_sentence(rng, 40)} <a href=\"/content/x{j}\">{_sentence(rng, 4)}</a></p>"
+                               for j in range(self.paragraphs))
+
+        return f'''<html><head><title>Article {article_id}</title></head><body>
+            <nav>{"".join(f'<a href="/section-{i}">Section {i}</a>' for i in range(60))}</nav>
+            <h1 class="o-topper__headline">{_sentence(rng, 10)}</h1>
+            <a data-trackable="author" href="/stream/author">Jane Example</a>
+            <time class="article-info__timestamp o3-editorial-typography-byline-timestamp o-date" datetime="{self.published_at(article_id).strftime('%Y-%m-%dT%H:%M:%S')}.000Z"></time>
+            <article id="article-body">{paragraphs}</article>
+            <footer>{"".join(f'<a href="/footer-{i}">Footer {i}</a>' for i in range(80))}</footer>
+        </body></html>'''
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        path = request.url.path
+
+        if path.startswith("/content/"):
+            article_id = int(path.rsplit("/", 1)[1])
+            body = self.article_page(article_id) if article_id < self.total_articles else None
+        elif path.startswith("/world"):
+            page = int(request.url.params.get("page", 1))
+            body = self.listing_page(page) if page <= self.pages else None
+        else:
+            body = None
+
+        if body is None:
+            return httpx.Response(404, text="Not found")
+
+        self.bytes_sent += len(body)
+        return httpx.Response(200, text=body)
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handle))
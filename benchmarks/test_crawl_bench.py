@@ -0,0 +1,163 @@
+"""End-to-end benchmarks of the scraping hot paths against the local fake FT server.
+
+Run with `pytest benchmarks -q`; results are written as JSON to `BENCH_OUTPUT`
+(default `bench_output.json`). Set `BENCH_DATABASE_URL` to a throwaway Postgres
+database to include the insert throughput benchmark.
+"""
+import os
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.scrap.extractors import EXTRACTORS
+from src.scrap.financial_parser import FinancialParser
+from src.scrap.schemas import PostSchema
+
+
+PERIOD = timedelta(days=365)
+
+
+def make_parser(client, bench_results):
+    return FinancialParser(
+        max_concurrency=bench_results["config"]["concurrency"],
+        rate_per_host=1_000_000,
+        client=client,
+    )
+
+
+@pytest.mark.asyncio
+async def test_end_to_end_crawl(fake_ft, bench_results):
+    async with fake_ft.client() as client:
+        parser = make_parser(client, bench_results)
+
+        start = time.perf_counter()
+        cpu_start = time.process_time()
+
+        posts = 0
+        async for _ in parser.iter_crawl(PERIOD):
+            posts += 1
+
+        elapsed = time.perf_counter() - start
+        cpu = time.process_time() - cpu_start
+
+    assert posts == fake_ft.total_articles
+
+    bench_results["results"]["end_to_end"] = {
+        "articles": posts,
+        "seconds": elapsed,
+        "articles_per_second": posts / elapsed,
+        "cpu_seconds": cpu,
+        "requests": fake_ft.requests,
+        "bytes_downloaded": fake_ft.bytes_sent,
+    }
+
+
+@pytest.mark.asyncio
+async def test_crawl_peak_memory(fake_ft, bench_results):
+    # Traced separately: tracemalloc slows allocation-heavy parsing down several times
+    async with fake_ft.client() as client:
+        parser = make_parser(client, bench_results)
+
+        tracemalloc.start()
+        posts = 0
+        async for _ in parser.iter_crawl(PERIOD):
+            posts += 1
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    assert posts == fake_ft.total_articles
+
+    bench_results["results"]["memory"] = {"peak_memory_bytes": peak}
+
+
+@pytest.mark.asyncio
+async def test_phase_timings(fake_ft, bench_results):
+    async with fake_ft.client() as client:
+        parser = make_parser(client, bench_results)
+
+        start = time.perf_counter()
+        await parser.parsing(PERIOD)
+        listing_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        posts = await parser.pars_post_data()
+        articles_seconds = time.perf_counter() - start
+
+    assert len(posts) == fake_ft.total_articles
+
+    bench_results["results"]["phases"] = {
+        "parsing_seconds": listing_seconds,
+        "pars_post_data_seconds": articles_seconds,
+        "sequential_total_seconds": listing_seconds + articles_seconds,
+    }
+
+
+@pytest.mark.parametrize("backend", list(EXTRACTORS))
+def test_parse_cpu_time(fake_ft, bench_results, backend):
+    extractor = EXTRACTORS[backend]()
+    listing = fake_ft.listing_page(1)
+    articles = [fake_ft.article_page(i) for i in range(fake_ft.articles_per_page)]
+
+    start = time.process_time()
+    extractor.extract_listing(listing)
+    listing_cpu = time.process_time() - start
+
+    start = time.process_time()
+    for html in articles:
+        extractor.extract_article(html)
+    articles_cpu = time.process_time() - start
+
+    bench_results["results"].setdefault("parse_cpu", {})[backend] = {
+        "listing_page_cpu_seconds": listing_cpu,
+        "article_cpu_seconds": articles_cpu / len(articles),
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not os.getenv("BENCH_DATABASE_URL"), reason="BENCH_DATABASE_URL is not set")
+async def test_db_insert_throughput(fake_ft, bench_results):
+    from sqlalchemy import delete
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+    from src.database import Base
+    from src.scrap.models import Post
+    from src.scrap.services import bulk_upsert_posts
+
+    engine = create_async_engine(os.getenv("BENCH_DATABASE_URL"))
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    prefix = f"https://bench.invalid/{time.time_ns()}/"
+    posts = [
+        PostSchema(
+            url=f"{prefix}{i}",
+            title=f"Benchmark post {i}",
+            content=fake_ft.article_page(i % fake_ft.articles_per_page),
+            author="Benchmark",
+            published_at=datetime.utcnow(),
+            scraped_at=datetime.utcnow(),
+        )
+        for i in range(fake_ft.total_articles)
+    ]
+
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        async with session_factory() as session:
+            start = time.perf_counter()
+            result = await bulk_upsert_posts(posts, session, chunk_size=100)
+            elapsed = time.perf_counter() - start
+
+            await session.execute(delete(Post).where(Post.url.startswith(prefix)))
+            await session.commit()
+    finally:
+        await engine.dispose()
+
+    assert result.inserted == len(posts)
+
+    bench_results["results"]["db_insert"] = {
+        "rows": len(posts),
+        "seconds": elapsed,
+        "rows_per_second": len(posts) / elapsed,
+    }
@@ -0,0 +1,37 @@
+"""add crawl checkpoints
+
+Revision ID: 16c430633cfc
+Revises: fbe01f0a7e4e
+Create Date: 2026-10-18 10:14:52.408117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '16c430633cfc'
+down_revision: Union[str, Sequence[str], None] = 'fbe01f0a7e4e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('crawl_checkpoints',
+    sa.Column('section', sa.String(length=126), nullable=False),
+    sa.Column('last_url', sa.String(length=164), nullable=True),
+    sa.Column('last_published_at', sa.DateTime(), nullable=True),
+    sa.Column('resume_page', sa.String(length=164), nullable=True),
+    sa.Column('run_url', sa.String(length=164), nullable=True),
+    sa.Column('run_published_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('section')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('crawl_checkpoints')
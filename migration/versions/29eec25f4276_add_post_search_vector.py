@@ -0,0 +1,54 @@
+"""add post search vector
+
+Revision ID: 29eec25f4276
+Revises: 3b755234068d
+Create Date: 2026-10-18 08:31:47.902114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '29eec25f4276'
+down_revision: Union[str, Sequence[str], None] = '3b755234068d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BATCH_SIZE = 1000
+
+BACKFILL_BATCH = sa.text("""
+    UPDATE posts
+    SET search_vector =
+        setweight(to_tsvector('english', title), 'A') ||
+        setweight(to_tsvector('english', regexp_replace(content, '<[^>]+>', ' ', 'g')), 'B')
+    WHERE id IN (
+        SELECT id FROM posts
+        WHERE search_vector IS NULL
+        ORDER BY id
+        LIMIT :batch_size
+    )
+""")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('posts', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+
+    # every batch commits on its own, so the row locks of a batch are released before the next one
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        while conn.execute(BACKFILL_BATCH, {"batch_size": BATCH_SIZE}).rowcount:
+            pass
+
+    op.create_index('ix_posts_search_vector', 'posts', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_posts_search_vector', table_name='posts', postgresql_using='gin')
+    op.drop_column('posts', 'search_vector')
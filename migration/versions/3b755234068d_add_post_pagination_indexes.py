@@ -0,0 +1,30 @@
+"""add post pagination indexes
+
+Revision ID: 3b755234068d
+Revises: c7786c856d87
+Create Date: 2026-10-18 08:05:12.481930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b755234068d'
+down_revision: Union[str, Sequence[str], None] = 'c7786c856d87'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_posts_published_at_id', 'posts', ['published_at', 'id'], unique=False)
+    op.create_index('ix_posts_author_published_at_id', 'posts', ['author', 'published_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_posts_author_published_at_id', table_name='posts')
+    op.drop_index('ix_posts_published_at_id', table_name='posts')
@@ -0,0 +1,40 @@
+"""add dead letters
+
+Revision ID: 47d010b88c45
+Revises: 16c430633cfc
+Create Date: 2026-10-18 11:37:20.915364
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '47d010b88c45'
+down_revision: Union[str, Sequence[str], None] = '16c430633cfc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('dead_letters',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('url', sa.String(length=164), nullable=False),
+    sa.Column('section', sa.String(length=126), nullable=True),
+    sa.Column('error', sa.Text(), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('first_failed_at', sa.DateTime(), nullable=False),
+    sa.Column('last_failed_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('url')
+    )
+    op.create_index('ix_dead_letters_last_failed_at', 'dead_letters', ['last_failed_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_dead_letters_last_failed_at', table_name='dead_letters')
+    op.drop_table('dead_letters')
@@ -0,0 +1,82 @@
+"""add post content hash and revisions
+
+Revision ID: b000489f04bc
+Revises: 47d010b88c45
+Create Date: 2026-10-18 13:05:41.732190
+
+"""
+import hashlib
+import logging
+import unicodedata
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b000489f04bc'
+down_revision: Union[str, Sequence[str], None] = '47d010b88c45'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+BATCH_SIZE = 500
+
+
+# Frozen copy of `src.scrap.extractors.content_hash` at the time of this revision
+def content_hash(title: str, content: str) -> str:
+    normalized = "\n".join(" ".join(unicodedata.normalize("NFC", text).split()) for text in (title, content))
+
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('posts', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.create_table('post_revisions',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('post_id', sa.Integer(), nullable=False),
+    sa.Column('previous_hash', sa.String(length=64), nullable=True),
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.Column('content_size', sa.Integer(), nullable=False),
+    sa.Column('revised_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['post_id'], ['posts.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_post_revisions_post_id_revised_at', 'post_revisions', ['post_id', 'revised_at'], unique=False)
+
+    # hash the stored posts, so their first re-scrape is compared instead of rewritten.
+    # Outside the migration transaction, the schema changes above are committed first
+    # and posts stay writable while the hashes are filled in.
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        last_id = 0
+        rows_done = 0
+
+        while True:
+            rows = conn.execute(
+                sa.text("SELECT id, title, content FROM posts WHERE id > :last_id ORDER BY id LIMIT :batch_size"),
+                {"last_id": last_id, "batch_size": BATCH_SIZE},
+            ).all()
+
+            if not rows:
+                break
+
+            conn.execute(
+                sa.text("UPDATE posts SET content_hash = :content_hash WHERE id = :post_id"),
+                [{"post_id": post_id, "content_hash": content_hash(title, content)} for post_id, title, content in rows],
+            )
+
+            last_id = rows[-1][0]
+            rows_done += len(rows)
+            logger.info(f"Hashed {rows_done} posts")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_post_revisions_post_id_revised_at', table_name='post_revisions')
+    op.drop_table('post_revisions')
+    op.drop_column('posts', 'content_hash')
@@ -0,0 +1,148 @@
+"""split post content and raw html
+
+Revision ID: fbe01f0a7e4e
+Revises: 29eec25f4276
+Create Date: 2026-10-18 09:02:36.117804
+
+"""
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import zstandard
+from bs4 import BeautifulSoup
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fbe01f0a7e4e'
+down_revision: Union[str, Sequence[str], None] = '29eec25f4276'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+BATCH_SIZE = 500
+
+
+# Frozen copies of the application helpers at the time of this revision, so
+# later changes to them never change what this migration writes.
+ZSTD_LEVEL = 10
+
+BLOCK_TAGS = ["p", "h1", "h2", "h3", "h4", "h5", "h6", "li", "blockquote", "figcaption", "pre", "td"]
+
+
+def compress_html(html: str) -> bytes:
+    return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(html.encode())
+
+
+def decompress_html(data: bytes) -> str:
+    return zstandard.ZstdDecompressor().decompress(data).decode()
+
+
+def html_to_text(element) -> str:
+    blocks = [el for el in element.find_all(BLOCK_TAGS) if el.find(BLOCK_TAGS) is None]
+
+    if not blocks:
+        blocks = [element]
+
+    paragraphs = (" ".join(block.get_text().split()) for block in blocks)
+
+    return "\n\n".join(paragraph for paragraph in paragraphs if paragraph)
+
+
+def _article_text(html: str) -> str:
+    article = BeautifulSoup(html, 'lxml').find('article')
+
+    return html_to_text(article) if article is not None else ""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('post_html',
+    sa.Column('post_id', sa.Integer(), nullable=False),
+    sa.Column('html_zstd', sa.LargeBinary(), nullable=False),
+    sa.Column('raw_size', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['post_id'], ['posts.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('post_id')
+    )
+
+    conn = op.get_bind()
+    last_id = 0
+    rows_done = before = text_size = compressed_size = 0
+
+    while True:
+        rows = conn.execute(
+            sa.text("SELECT id, content FROM posts WHERE id > :last_id ORDER BY id LIMIT :batch_size"),
+            {"last_id": last_id, "batch_size": BATCH_SIZE},
+        ).all()
+
+        if not rows:
+            break
+
+        html_rows = []
+        content_rows = []
+
+        for post_id, html in rows:
+            text = _article_text(html)
+            html_zstd = compress_html(html)
+            raw_size = len(html.encode())
+
+            html_rows.append({"post_id": post_id, "html_zstd": html_zstd, "raw_size": raw_size})
+            content_rows.append({"post_id": post_id, "content": text})
+
+            before += raw_size
+            text_size += len(text.encode())
+            compressed_size += len(html_zstd)
+
+        conn.execute(
+            sa.text("INSERT INTO post_html (post_id, html_zstd, raw_size) VALUES (:post_id, :html_zstd, :raw_size)"),
+            html_rows,
+        )
+        conn.execute(
+            sa.text("""
+                UPDATE posts SET
+                    content = :content,
+                    search_vector = setweight(to_tsvector('english', title), 'A') ||
+                                    setweight(to_tsvector('english', :content), 'B')
+                WHERE id = :post_id
+            """),
+            content_rows,
+        )
+
+        last_id = rows[-1][0]
+        rows_done += len(rows)
+        logger.info(f"Rewrote {rows_done} posts")
+
+    after = text_size + compressed_size
+    logger.info(
+        f"Storage report: {rows_done} posts, content before {before} bytes, "
+        f"after {after} bytes (plain text {text_size} + compressed html {compressed_size}), "
+        f"saved {before - after} bytes ({(before - after) / before:.1%})" if before else
+        "Storage report: no posts to rewrite"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    conn = op.get_bind()
+    last_id = 0
+
+    while True:
+        rows = conn.execute(
+            sa.text("SELECT post_id, html_zstd FROM post_html WHERE post_id > :last_id ORDER BY post_id LIMIT :batch_size"),
+            {"last_id": last_id, "batch_size": BATCH_SIZE},
+        ).all()
+
+        if not rows:
+            break
+
+        conn.execute(
+            sa.text("UPDATE posts SET content = :content WHERE id = :post_id"),
+            [{"post_id": post_id, "content": decompress_html(html_zstd)} for post_id, html_zstd in rows],
+        )
+
+        last_id = rows[-1][0]
+
+    op.drop_table('post_html')
@@ -1,10 +1,28 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from prometheus_client import make_asgi_app
 
+from src.database import async_session_manager
 from src.scrap import scrap
 from fastapi_pagination import add_pagination
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await async_session_manager.warm_up()
+    yield
+    await async_session_manager.close()
+
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
+
+app.add_middleware(GZipMiddleware, minimum_size=1000)
 
 add_pagination(app)
 
 app.include_router(scrap)
+
+app.mount("/metrics", make_asgi_app())
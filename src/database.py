@@ -1,11 +1,19 @@
 import os
+import time
+import asyncio
+import logging
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
 from dotenv import load_dotenv
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker, AsyncEngine, AsyncConnection
 from sqlalchemy.orm import declarative_base
 
+logger = logging.getLogger(__name__)
+
 
 load_dotenv()
 
@@ -17,14 +25,139 @@ SQL_DATABASE_URL = (f"postgresql+asyncpg://"
                     f"{os.getenv('DB_NAME')}")
 
 
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+
+    if value is None:
+        return default
+
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """The default asyncpg pool, also measuring how long checkouts wait for a connection.
+
+    Only checkouts that miss the per-session connection go through `_do_get`, so
+    the latency covers both waiting for a free slot and opening a new connection.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _do_get(self):
+        start = time.perf_counter()
+
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            wait = time.perf_counter() - start
+            self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    @property
+    def stats(self) -> dict[str, int | float]:
+        capacity = self.size() + max(self._max_overflow, 0)
+
+        return {
+            "size": self.size(),
+            "max_overflow": self._max_overflow,
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            "overflow": self.overflow(),
+            "saturation": self.checkedout() / capacity if capacity else 0.0,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "avg_checkout_latency": self.total_wait / self.checkouts if self.checkouts else 0.0,
+            "max_checkout_latency": self.max_wait,
+        }
+
+
+def engine_options() -> dict:
+    """Read the engine settings from the environment.
+
+    `DB_NULL_POOL` disables pooling. This is for processes that run every job on
+    a new event loop, e.g. with `asyncio.run`, since asyncpg connections cannot
+    be reused across loops.
+    """
+    options = {
+        "echo": _env_bool("DB_ECHO", False),
+        "pool_pre_ping": _env_bool("DB_POOL_PRE_PING", True),
+        "connect_args": {
+            "prepared_statement_cache_size": int(os.getenv("DB_STATEMENT_CACHE_SIZE", 100)),
+        },
+    }
+
+    if _env_bool("DB_NULL_POOL", False):
+        options["poolclass"] = NullPool
+    else:
+        options.update(
+            poolclass=InstrumentedQueuePool,
+            pool_size=int(os.getenv("DB_POOL_SIZE", 5)),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", 10)),
+            pool_timeout=float(os.getenv("DB_POOL_TIMEOUT", 30)),
+            pool_recycle=int(os.getenv("DB_POOL_RECYCLE", 1800)),
+        )
+
+    return options
+
+
 class AsyncDatabaseSessionManager:
-    def __init__(self, sql_url):
-        self._engine = create_async_engine(sql_url, future=True, echo=True)
+    def __init__(self, sql_url, **engine_kwargs):
+        self._engine = create_async_engine(sql_url, future=True, **engine_kwargs)
         self._session = async_sessionmaker(
             self._engine, expire_on_commit=False, class_= AsyncSession
         )
 
 
+    @property
+    def pool_stats(self) -> dict[str, int | float]:
+        pool = self._engine.pool
+
+        if isinstance(pool, InstrumentedQueuePool):
+            return pool.stats
+
+        return {"pool": type(pool).__name__}
+
+
+    async def warm_up(self, connections: int | None = None):
+        """Open `connections` pooled connections up front, the whole pool size by default.
+
+        A failed warm-up is only logged, the application still starts and connects
+        lazily once the database is reachable.
+        """
+        pool = self._engine.pool
+
+        if not isinstance(pool, InstrumentedQueuePool):
+            return
+
+        connections = connections or pool.size()
+
+        async def ping():
+            async with self._engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        start = time.perf_counter()
+
+        try:
+            await asyncio.gather(*(ping() for _ in range(connections)))
+        except Exception as e:
+            logger.warning(f"Database warm-up failed: {e}")
+            return
+
+        logger.info(f"Database pool warmed up with {connections} connections in {time.perf_counter() - start:.3f}s")
+
+
+    async def close(self):
+        await self._engine.dispose()
+
+
     @asynccontextmanager
     async def connect(self) -> AsyncIterator[AsyncConnection]:
         async with self._engine.begin() as conn:
@@ -52,7 +185,7 @@ class AsyncDatabaseSessionManager:
             await session.close()
 
 
-async_session_manager = AsyncDatabaseSessionManager(SQL_DATABASE_URL)
+async_session_manager = AsyncDatabaseSessionManager(SQL_DATABASE_URL, **engine_options())
 
 Base = declarative_base()
 
@@ -0,0 +1,333 @@
+"""Backfill of listing sections over an explicit publication date range.
+
+Usage:
+    python -m src.scrap.backfill --start 2025-01-01 --end 2025-02-01 [--section ft-world] [--partitions 4]
+        [--pages 10:80] [--max-rate 4] [--revisit]
+
+The listing pages holding `[start, end)` are located by probing page numbers,
+then split into contiguous page ranges crawled in parallel. Every partition of a
+section goes through one `AdaptiveScheduler`, so the request rate of the whole
+backfill backs off on 429 and error answers and grows again while they stay rare.
+"""
+import os
+import json
+import time
+import asyncio
+import logging
+import argparse
+
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+
+from src.database import async_session_manager, get_db_session
+from src.scrap import services
+from src.scrap.financial_parser import FinancialParser
+from src.scrap.http_client import close_http_client
+from src.scrap.parse_pool import get_parse_pool, shutdown_parse_pool
+from src.scrap.scheduler import AdaptiveScheduler
+from src.scrap.schemas import UpsertResultSchema
+from src.scrap.sharding import chunked
+from src.scrap.sink import PostSink
+from src.scrap.sources import SECTIONS, Section, get_section
+from src.scrap.url_index import KnownUrlIndex
+
+logger = logging.getLogger(__name__)
+
+
+# The FT listings stop paginating long before this
+MAX_LISTING_PAGE = 1000
+
+PROGRESS_INTERVAL = float(os.getenv("BACKFILL_PROGRESS_INTERVAL", 30))
+
+
+async def first_page_where(predicate: Callable[[int], Awaitable[bool]], max_page: int = MAX_LISTING_PAGE) -> int:
+    """Smallest page number for which `predicate` holds, or `max_page + 1` if there is none.
+
+    `predicate` must be false up to some page and true from there on. The page is
+    bracketed by doubling and then found by bisection, so a listing of `n` pages
+    costs about `2 * log2(n)` probes.
+    """
+    low, high = 0, 1
+
+    while high <= max_page and not await predicate(high):
+        low, high = high, high * 2
+
+    high = min(high, max_page + 1)
+
+    while high - low > 1:
+        middle = (low + high) // 2
+
+        if await predicate(middle):
+            high = middle
+        else:
+            low = middle
+
+    return high
+
+
+async def locate_pages(parser: FinancialParser, start: datetime, end: datetime,
+                       max_page: int = MAX_LISTING_PAGE) -> range:
+    """Listing pages holding the articles published in `[start, end)`.
+
+    Listing pages go from the newest article to the oldest. The range starts at
+    the first page with a teaser older than `end` and stops after the last page
+    with a teaser at least as new as `start`. A page past the end of the listing
+    has no teaser.
+    """
+    probes: dict[int, list[datetime]] = {}
+
+    async def dates(number: int) -> list[datetime]:
+        if number not in probes:
+            probes[number] = await parser.probe_listing_page(number)
+
+        return probes[number]
+
+    async def older_than_end(number: int) -> bool:
+        page = await dates(number)
+        return not page or min(page) < end
+
+    async def older_than_start(number: int) -> bool:
+        page = await dates(number)
+        return not page or max(page) < start
+
+    first = await first_page_where(older_than_end, max_page)
+    stop = await first_page_where(older_than_start, max_page)
+
+    logger.info(f"Located {parser.section} pages {first}-{stop - 1} with {len(probes)} probes")
+
+    return range(first, max(first, stop))
+
+
+def split_pages(pages: range, partitions: int) -> list[range]:
+    """Split `pages` into at most `partitions` contiguous ranges of nearly equal length."""
+    if partitions < 1:
+        raise ValueError("Backfill partitions must be at least 1")
+
+    size = max(1, -(-len(pages) // partitions))
+
+    return [range(chunk[0], chunk[-1] + 1) for chunk in chunked(list(pages), size)]
+
+
+class BackfillProgress:
+    """Listing pages and posts done by the partitions of one section backfill.
+
+    Attributes:
+        section (str): Name of the section.
+        pages_total (int): Listing pages of every partition.
+        pages_done (int): Listing pages whose links have been queued.
+        partitions_total (int): Number of partitions.
+        partitions_done (int): Partitions that finished, successfully or not.
+        partitions_failed (int): Partitions that stopped on an error.
+        fetched (int): Articles parsed.
+        result (UpsertResultSchema): Counts of the posts written.
+        failed (int): Posts lost to failed flushes.
+        dead_letters (int): Articles left to the dead letter retries.
+    """
+    def __init__(self, section: str, partitions: list[range]):
+        self.section = section
+        self.pages_total = sum(len(pages) for pages in partitions)
+        self.pages_done = 0
+        self.partitions_total = len(partitions)
+        self.partitions_done = 0
+        self.partitions_failed = 0
+        self.fetched = 0
+        self.result = UpsertResultSchema()
+        self.failed = 0
+        self.dead_letters = 0
+        self._started_at = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self._started_at
+
+    def page_done(self, number: int):
+        self.pages_done += 1
+
+    def partition_done(self, sink: PostSink | None, dead_letters: int = 0):
+        self.partitions_done += 1
+
+        if sink is None:
+            self.partitions_failed += 1
+            return
+
+        self.result.inserted += sink.result.inserted
+        self.result.updated += sink.result.updated
+        self.result.skipped += sink.result.skipped
+        self.failed += sink.failed
+        self.dead_letters += dead_letters
+
+    def describe(self) -> str:
+        elapsed = self.elapsed
+        message = (f"Backfill {self.section}: {self.pages_done}/{self.pages_total} pages, "
+                   f"{self.partitions_done}/{self.partitions_total} partitions, {self.fetched} articles "
+                   f"({self.fetched / elapsed if elapsed > 0 else 0.0:.2f}/s)")
+
+        if 0 < self.pages_done < self.pages_total:
+            eta = elapsed * (self.pages_total - self.pages_done) / self.pages_done
+            message += f", about {eta:.0f}s left"
+
+        return message
+
+    def as_dict(self) -> dict:
+        return {
+            "section": self.section,
+            "pages": self.pages_done,
+            "partitions": self.partitions_total,
+            "failed_partitions": self.partitions_failed,
+            "fetched": self.fetched,
+            **self.result.model_dump(),
+            "failed": self.failed,
+            "dead_letters": self.dead_letters,
+            "duration": self.elapsed,
+        }
+
+
+async def report_progress(progress: BackfillProgress, interval: float = PROGRESS_INTERVAL):
+    while True:
+        await asyncio.sleep(interval)
+        logger.info(progress.describe())
+
+
+async def crawl_partition(parser: FinancialParser, section: Section, pages: range, start: datetime, end: datetime,
+                          progress: BackfillProgress):
+    """Crawl the listing pages `pages` of `section` and write their articles from `[start, end)`."""
+    async for session in get_db_session():
+        async with PostSink(session) as sink:
+            async for post in parser.iter_backfill(pages, start, end, on_page=progress.page_done):
+                progress.fetched += 1
+                await sink.add(post)
+
+        letters = [letter.model_copy(update={"section": section.name}) for letter in parser.dead_letters]
+
+        if letters:
+            res = await services.save_dead_letters(letters, session)
+
+            if isinstance(res, Exception):
+                logger.error(f"Lost {len(letters)} dead letters of {section.name}: {res}")
+
+    progress.partition_done(sink, len(parser.dead_letters))
+    logger.info(f"Partition {pages.start}-{pages.stop - 1} of {section.name} done: "
+                f"saved {sink.result.inserted}, failed {sink.failed}")
+
+
+async def backfill_section(section: Section, start: datetime, end: datetime, partitions: int = 4,
+                           pages: range | None = None, max_rate: float | None = None, revisit: bool = False,
+                           progress_interval: float = PROGRESS_INTERVAL) -> dict:
+    """Crawl every article of `section` published in `[start, end)`.
+
+    Args:
+        section (Section): The section to backfill.
+        start (datetime): Oldest publication date, inclusive.
+        end (datetime): Newest publication date, exclusive.
+        partitions (int): Number of page ranges crawled in parallel.
+        pages (range | None): Listing pages to crawl, located by probing when None.
+        max_rate (float | None): Highest requests per second the adaptive scheduler
+            may reach, twice the rate of the section by default.
+        revisit (bool): Fetch the articles already stored too, to record the ones
+            that changed since as revisions.
+        progress_interval (float): Seconds between two progress log lines.
+
+    Returns:
+        dict: Counts of pages, articles and posts written, see `BackfillProgress`.
+    """
+    scheduler = AdaptiveScheduler(max_concurrency=section.max_concurrency, rate_per_host=section.rate_per_host,
+                                  max_rate=max_rate)
+    known_urls = None if revisit else KnownUrlIndex()
+    parse_pool = get_parse_pool() if os.getenv("PARSE_POOL_WORKERS") else None
+
+    if known_urls is not None:
+        async for session in get_db_session():
+            await known_urls.refresh(session)
+
+    def make_parser() -> FinancialParser:
+        parser = FinancialParser.from_section(section, known_urls=known_urls, parse_pool=parse_pool)
+        parser.scheduler = scheduler
+        return parser
+
+    if pages is None:
+        pages = await locate_pages(make_parser(), start, end)
+
+    ranges = split_pages(pages, partitions)
+    progress = BackfillProgress(section.name, ranges)
+
+    logger.info(f"Backfill of {section.name} from {start} to {end}: "
+                f"{len(pages)} listing pages in {len(ranges)} partitions")
+
+    reporter = asyncio.create_task(report_progress(progress, progress_interval))
+
+    try:
+        results = await asyncio.gather(
+            *(crawl_partition(make_parser(), section, part, start, end, progress) for part in ranges),
+            return_exceptions=True,
+        )
+    finally:
+        reporter.cancel()
+
+    for part, res in zip(ranges, results):
+        if isinstance(res, Exception):
+            logger.error(f"Partition {part.start}-{part.stop - 1} of {section.name} failed: {res!r}")
+            progress.partition_done(None)
+
+    logger.info(f"DONE {progress.describe()}")
+
+    return progress.as_dict()
+
+
+def _parse_date(value: str) -> datetime:
+    """An ISO date or datetime, as the naive UTC datetimes of the listing teasers."""
+    date = datetime.fromisoformat(value)
+
+    if date.tzinfo is not None:
+        date = date.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return date
+
+
+def _parse_pages(value: str) -> range:
+    """A `FIRST:LAST` range of listing pages, both included."""
+    first, _, last = value.partition(":")
+
+    try:
+        return range(int(first), int(last) + 1)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid page range: {value}, expected FIRST:LAST") from None
+
+
+async def run(args: argparse.Namespace) -> list[dict]:
+    try:
+        return [
+            await backfill_section(get_section(name), args.start, args.end, partitions=args.partitions,
+                                   pages=args.pages, max_rate=args.max_rate, revisit=args.revisit)
+            for name in args.section or ["ft-world"]
+        ]
+    finally:
+        await close_http_client()
+        await async_session_manager.close()
+        shutdown_parse_pool()
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--start", type=_parse_date, required=True, help="Oldest publication date, inclusive")
+    parser.add_argument("--end", type=_parse_date, required=True, help="Newest publication date, exclusive")
+    parser.add_argument("--section", action="append", choices=list(SECTIONS),
+                        help="Section to backfill, may be repeated (default: ft-world)")
+    parser.add_argument("--partitions", type=int, default=4, help="Page ranges crawled in parallel")
+    parser.add_argument("--pages", type=_parse_pages, help="Listing pages FIRST:LAST, skips locating them")
+    parser.add_argument("--max-rate", type=float, help="Highest requests per second per host")
+    parser.add_argument("--revisit", action="store_true", help="Fetch stored articles again to record their revisions")
+    args = parser.parse_args(argv)
+
+    if args.start >= args.end:
+        parser.error("--start must be before --end")
+
+    if args.partitions < 1:
+        parser.error("--partitions must be at least 1")
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,11 @@
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_init, worker_process_shutdown, worker_shutdown
+
+from src.scrap.http_client import shutdown_http_clients
+from src.scrap.parse_pool import shutdown_parse_pool
+from src.scrap.metrics import start_metrics_server
+from src.scrap.worker_loop import shutdown_worker_loop
 
 
 celery_app = Celery('app', broker="redis://redis:6379/0", backend="redis://redis:6379/1")
@@ -14,6 +20,27 @@ celery_app.conf.beat_schedule = {
         'schedule': crontab(hour=1),
         'options': {'queue': 'hourly_crawls'},
     },   
+   'retry-dead-letters': {
+        'task': 'src.scrap.tasks.retry_dead_letters_task',
+        'schedule': crontab(minute=0, hour='*/6'),
+    },
+   'revisit-recent-articles': {
+        'task': 'src.scrap.tasks.revisit_recent_task',
+        'schedule': crontab(minute=30, hour='*/6'),
+    },
 }
 
 celery_app.autodiscover_tasks(['src.scrap.tasks'], force=True)
+
+
+@worker_init.connect
+def start_worker_metrics(**kwargs):
+    start_metrics_server()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def shutdown_worker_resources(**kwargs):
+    shutdown_worker_loop()
+    shutdown_http_clients()
+    shutdown_parse_pool()
@@ -0,0 +1,149 @@
+import logging
+
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime
+
+from src.scrap import services
+from src.scrap.schemas import CrawlCheckpointSchema
+
+logger = logging.getLogger(__name__)
+
+
+class ListingPage:
+    """A listing page of the current run and how many of its links are still in flight."""
+    def __init__(self):
+        self.pending = 0
+        self.closed = False
+        self.next_page: str | None = None
+        self.on_saved: Callable[[], None] | None = None
+
+    @property
+    def complete(self) -> bool:
+        return self.closed and self.pending == 0
+
+
+class CrawlCheckpoint:
+    """The persisted position of the crawl of one listing section.
+
+    `last_url` and `last_published_at` mark the newest article stored by the last
+    finished run, and pagination stops as soon as it reaches it. While a run is
+    in progress, the newest article it has seen is kept in `run_url` and
+    `run_published_at`. It only becomes the stop mark once the run finishes, so a
+    crash never hides the articles between the two marks.
+
+    Listing pages are tracked from the consumer side. A page is complete once
+    every one of its links has been handed to the consumer, and `resume_page` is
+    the page after the last complete one, counting only pages with no incomplete
+    page before them. The consumer saves the checkpoint after every successful
+    flush, so a crashed run resumes from there. The `on_saved` callback of a
+    page, e.g. caching its validators, only runs once a save has moved past it.
+
+    Attributes:
+        section (str): Name of the section.
+        last_url (str | None): URL of the newest article of the last finished run.
+        last_published_at (datetime | None): Publication date of that article.
+        resume_page (str | None): Listing page a crashed run resumes from.
+        run_url (str | None): URL of the newest article of the unfinished run.
+        run_published_at (datetime | None): Publication date of that article.
+    """
+    def __init__(self, section: str, last_url: str | None = None, last_published_at: datetime | None = None,
+                 resume_page: str | None = None, run_url: str | None = None, run_published_at: datetime | None = None):
+        self.section = section
+        self.last_url = last_url
+        self.last_published_at = last_published_at
+        self.resume_page = resume_page
+        self.run_url = run_url
+        self.run_published_at = run_published_at
+        self._pages: deque[ListingPage] = deque()
+        self._saved_callbacks: list[Callable[[], None]] = []
+
+    @classmethod
+    async def load(cls, section: str, db) -> "CrawlCheckpoint":
+        """Load the checkpoint of `section`, or an empty one for a section never crawled."""
+        data = await services.get_crawl_checkpoint(section, db)
+
+        if data is None:
+            return cls(section)
+
+        checkpoint = cls(**data.model_dump(exclude={"updated_at"}))
+
+        if checkpoint.resume_page is not None:
+            logger.info(f"Resuming crawl of {section} from {checkpoint.resume_page}")
+
+        return checkpoint
+
+    async def save(self, db):
+        """Persist the checkpoint with the pages completed so far."""
+        self.advance()
+
+        res = await services.save_crawl_checkpoint(
+            CrawlCheckpointSchema(
+                section=self.section,
+                last_url=self.last_url,
+                last_published_at=self.last_published_at,
+                resume_page=self.resume_page,
+                run_url=self.run_url,
+                run_published_at=self.run_published_at,
+            ),
+            db,
+        )
+
+        if isinstance(res, Exception):
+            logger.error(f"Failed to save crawl checkpoint of {self.section}: {res}")
+            return
+
+        callbacks, self._saved_callbacks = self._saved_callbacks, []
+
+        for callback in callbacks:
+            callback()
+
+    @property
+    def has_mark(self) -> bool:
+        return self.last_url is not None and self.last_published_at is not None
+
+    def reached(self, url: str, published_at: datetime) -> bool:
+        """Whether a teaser is the last stored article or older than it."""
+        return url == self.last_url or published_at < self.last_published_at
+
+    def see(self, url: str, published_at: datetime):
+        """Remember the first teaser of a run as its newest article."""
+        if self.run_url is None:
+            self.run_url = url
+            self.run_published_at = published_at
+
+    def open_page(self) -> ListingPage:
+        page = ListingPage()
+        self._pages.append(page)
+
+        return page
+
+    def close_page(self, page: ListingPage, next_page: str | None, on_saved: Callable[[], None] | None = None):
+        page.closed = True
+        page.next_page = next_page
+        page.on_saved = on_saved
+
+    def advance(self):
+        """Move `resume_page` past every leading complete page."""
+        while self._pages and self._pages[0].complete:
+            page = self._pages.popleft()
+
+            if page.next_page:
+                self.resume_page = page.next_page
+
+            if page.on_saved is not None:
+                self._saved_callbacks.append(page.on_saved)
+
+    def finish(self):
+        """Make the newest article of the run the stop mark of the next run."""
+        if self.run_url is not None:
+            self.last_url = self.run_url
+            self.last_published_at = self.run_published_at
+
+        # every page is complete by now, its callbacks still wait for the next save
+        self._saved_callbacks.extend(page.on_saved for page in self._pages if page.on_saved is not None)
+
+        self.resume_page = None
+        self.run_url = None
+        self.run_published_at = None
+        self._pages.clear()
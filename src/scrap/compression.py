@@ -0,0 +1,12 @@
+import zstandard
+
+
+ZSTD_LEVEL = 10
+
+
+def compress_html(html: str) -> bytes:
+    return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(html.encode())
+
+
+def decompress_html(data: bytes) -> str:
+    return zstandard.ZstdDecompressor().decompress(data).decode()
@@ -1,4 +1,6 @@
-from fastapi import Depends
+from datetime import datetime
+
+from fastapi import Depends, Path, Query
 from fastapi.exceptions import HTTPException
 from src.scrap import services
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,5 +17,48 @@ async def valid_list_post(db:AsyncSession = Depends(get_db_session)):
     return list_post
 
 
+async def valid_post(post_id: int = Path(ge=1), db: AsyncSession = Depends(get_db_session)):
+    post = await services.get_post(post_id, db)
+
+    if post is None:
+        raise HTTPException(
+            detail=f"Post {post_id} not found",
+            status_code=404)
+
+    return post
+
+
+async def valid_post_html(post_id: int = Path(ge=1), db: AsyncSession = Depends(get_db_session)):
+    html = await services.get_post_html(post_id, db)
+
+    if html is None:
+        raise HTTPException(
+            detail=f"HTML of post {post_id} not found",
+            status_code=404)
+
+    return html
+
+
+async def valid_post_revisions(post = Depends(valid_post), db: AsyncSession = Depends(get_db_session)):
+    return await services.get_post_revisions(post.id, db)
+
+
 def valid_all_post_query():
     return services.get_all_post_query()
+
+
+def valid_search_query(q: str = Query(min_length=2, max_length=256, description="Web search syntax: words, \"phrases\", or, -exclude")):
+    return services.get_search_query(q)
+
+
+def valid_post_page_query(
+    date_from: datetime | None = Query(None, description="Published at or after (inclusive)"),
+    date_to: datetime | None = Query(None, description="Published before (exclusive)"),
+    author: str | None = Query(None),
+):
+    if date_from and date_to and date_from >= date_to:
+        raise HTTPException(
+            detail="date_from must be earlier than date_to",
+            status_code=422)
+
+    return services.get_post_page_query(date_from, date_to, author)
@@ -0,0 +1,210 @@
+import hashlib
+import unicodedata
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+
+def parse_datetime(date_val: str) -> datetime:
+    """Parse an FT `datetime` attribute, dropping the fractional seconds part.
+
+    Raises:
+        ValueError: If the value is not in the '%Y-%m-%dT%H:%M:%S' format.
+    """
+    if '.' in date_val:
+        date_val = date_val.split('.')[0]
+
+    return datetime.strptime(date_val, '%Y-%m-%dT%H:%M:%S')
+
+
+BLOCK_TAGS = ["p", "h1", "h2", "h3", "h4", "h5", "h6", "li", "blockquote", "figcaption", "pre", "td"]
+
+
+def html_to_text(element) -> str:
+    """Convert an article element into plain text, one paragraph per block element.
+
+    Only the innermost block elements are used so nested blocks are not repeated,
+    and whitespace inside every paragraph is collapsed.
+    """
+    blocks = [el for el in element.find_all(BLOCK_TAGS) if el.find(BLOCK_TAGS) is None]
+
+    if not blocks:
+        blocks = [element]
+
+    paragraphs = (" ".join(block.get_text().split()) for block in blocks)
+
+    return "\n\n".join(paragraph for paragraph in paragraphs if paragraph)
+
+
+def content_hash(title: str, content: str) -> str:
+    """SHA-256 of the normalized title and body of an article, as 64 hex characters.
+
+    Text is NFC-normalized and runs of whitespace collapse to one space, so
+    reflowed markup or another extractor backend give the same hash.
+    """
+    normalized = "\n".join(" ".join(unicodedata.normalize("NFC", text).split()) for text in (title, content))
+
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+class Extractor(ABC):
+    """Turns raw FT HTML into compact records.
+
+    Implementations must return identical records for the same page so that
+    backends can be swapped without changing what ends up in the database.
+    """
+    name: str
+
+    @abstractmethod
+    def extract_article(self, html: str) -> dict | None:
+        """Extract an article page.
+
+        Returns:
+            dict | None: The `title`, `author`, `content` (plain text), `raw_html`
+                (the `<article>` markup) and `published_at` of the article, or None
+                if the article is paywalled.
+
+        Raises:
+            Exception: If a required element is missing from the page.
+        """
+
+    @abstractmethod
+    def extract_listing(self, html: str) -> tuple[list[tuple[str | None, str | None]], str | None]:
+        """Extract a listing page.
+
+        Returns:
+            tuple: A list of `(href, datetime)` pairs for every teaser, in page order,
+                and the href of the next listing page or None on the last page.
+        """
+
+
+class SoupExtractor(Extractor):
+    """Reference backend building a full BeautifulSoup tree of every page."""
+    name = "soup"
+
+    def _article_soup(self, html: str) -> BeautifulSoup:
+        return BeautifulSoup(html, 'lxml')
+
+    def _listing_soup(self, html: str) -> BeautifulSoup:
+        return BeautifulSoup(html, 'lxml')
+
+    def extract_article(self, html: str) -> dict | None:
+        soup = self._article_soup(html)
+
+        subscribe_el = soup.find("a", id="charge-button")
+
+        if subscribe_el:
+            return None
+
+        header_el = soup.find('h1', class_='o-topper__headline')
+
+        authors_els = soup.find_all('a', attrs={"data-trackable": "author"})
+
+        article_el = soup.find('article', id="article-body")
+
+        article_time_el = soup.find('time', class_="article-info__timestamp o3-editorial-typography-byline-timestamp o-date")
+
+        return {
+            "title": header_el.text,
+            "author": "".join([author.text for author in authors_els]),
+            "content": html_to_text(article_el),
+            "raw_html": str(article_el),
+            "published_at": parse_datetime(article_time_el.get("datetime")),
+        }
+
+    def extract_listing(self, html: str) -> tuple[list[tuple[str | None, str | None]], str | None]:
+        soup = self._listing_soup(html)
+
+        teasers = []
+
+        for post in soup.find_all('li', class_="o-teaser-collection__item o-grid-row"):
+            a = post.find('a', attrs={"data-trackable": "heading-link"})
+            time = post.find('time', class_='o3-type-label o-date')
+
+            teasers.append((
+                a.get("href") if a else None,
+                time.get("datetime") if time else None,
+            ))
+
+        next_page = None
+        pagination = soup.find("div", class_="stream__pagination")
+
+        if pagination:
+            pag_a = pagination.find('a', attrs={'data-trackable': 'next-page'})
+
+            if pag_a:
+                next_page = pag_a.get("href")
+
+        return teasers, next_page
+
+
+class _TagStrainer(SoupStrainer):
+    """A SoupStrainer deciding from a tag name and its raw attributes whether to build it.
+
+    Once a tag is accepted its whole subtree is kept, so searching the strained
+    tree finds exactly what searching the full tree would.
+    """
+    def __init__(self, predicate):
+        super().__init__()
+        self.predicate = predicate
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        return self.predicate(name, attrs or {})
+
+    def allow_string_creation(self, string: str) -> bool:
+        return False
+
+
+def _classes(attrs) -> list[str]:
+    value = attrs.get("class") or ""
+
+    return value.split() if isinstance(value, str) else list(value)
+
+
+def _is_article_element(name, attrs) -> bool:
+    if name in ("h1", "article", "time"):
+        return True
+
+    return name == "a" and (attrs.get("id") == "charge-button" or attrs.get("data-trackable") == "author")
+
+
+def _is_listing_element(name, attrs) -> bool:
+    if name == "li":
+        return "o-teaser-collection__item" in _classes(attrs)
+
+    return name == "div" and "stream__pagination" in _classes(attrs)
+
+
+class StrainedSoupExtractor(SoupExtractor):
+    """Fast backend that only builds the parts of the page the extraction reads.
+
+    The pages are still tokenised by lxml, but BeautifulSoup objects are only
+    created for the handful of elements `SoupExtractor` looks up and for their
+    descendants. Navigation, scripts, related stories and footers are skipped,
+    which is where most of the tree building time goes.
+    """
+    name = "strained"
+
+    article_strainer = _TagStrainer(_is_article_element)
+    listing_strainer = _TagStrainer(_is_listing_element)
+
+    def _article_soup(self, html: str) -> BeautifulSoup:
+        return BeautifulSoup(html, 'lxml', parse_only=self.article_strainer)
+
+    def _listing_soup(self, html: str) -> BeautifulSoup:
+        return BeautifulSoup(html, 'lxml', parse_only=self.listing_strainer)
+
+
+EXTRACTORS: dict[str, type[Extractor]] = {
+    SoupExtractor.name: SoupExtractor,
+    StrainedSoupExtractor.name: StrainedSoupExtractor,
+}
+
+
+def get_extractor(name: str) -> Extractor:
+    try:
+        return EXTRACTORS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown extractor backend: {name}") from None
@@ -1,12 +1,21 @@
+import time
 import httpx
 import asyncio
 import logging
 
 from datetime import datetime, timedelta
 
-from bs4 import BeautifulSoup
-
-from src.scrap.schemas import PostSchema
+from src.scrap.schemas import PostSchema, DeadLetterSchema
+from src.scrap.scheduler import FetchScheduler, get_shared_scheduler
+from src.scrap.http_client import get_http_client
+from src.scrap.http_cache import HttpCache
+from src.scrap.url_index import KnownUrlIndex
+from src.scrap.extractors import Extractor, StrainedSoupExtractor, content_hash, get_extractor, parse_datetime
+from src.scrap.parse_pool import ParsePool
+from src.scrap.checkpoint import CrawlCheckpoint
+from src.scrap.sources import Section
+from src.scrap.retry import CircuitOpenError, is_transient
+from src.scrap import metrics
 
 logger = logging.getLogger(__name__)
 
@@ -18,15 +27,49 @@ class FinancialParser:
     filters them by a specified time period, and extracts detailed information
     (e.g., title, author, content) for each article. It uses asynchronous HTTP
     requests for efficiency and handles paywalled content and errors gracefully.
+    Parsers for the other sections of `src.scrap.sources.SECTIONS` are created
+    with `from_section`.
 
     Attributes:
         headers (dict): HTTP headers to mimic a browser request.
         base_url (str): Base URL of the Financial Times website.
         start_page (str): Starting page for scraping (e.g., '/world').
+        section (str): Name of the section, the `section` label of the crawl metrics
+            (e.g., 'ft-world').
         post_list_link (list): List of article URLs collected during scraping.
         article_data (list): List of parsed article data as PostSchema objects.
+        scheduler (FetchScheduler): Limits concurrent requests and rate limits them per host.
+        client (httpx.AsyncClient | None): Client used for every request. Defaults to the
+            shared per-process HTTP/2 client, so listing and article phases and
+            consecutive task runs reuse the same connections.
+        cache (HttpCache | None): Validator cache used to send conditional requests for
+            listing pages and skip the ones that answer 304 Not Modified. Articles
+            are always fetched in full: the known URLs already filter the stored
+            ones, so a 304 could only hide an article that was never written.
+        known_urls (KnownUrlIndex | None): URLs already stored in the database. Matching
+            links are dropped before they are queued for fetching.
+        extractor (Extractor): Backend turning listing and article HTML into records.
+            Defaults to `StrainedSoupExtractor`.
+        parse_pool (ParsePool | None): When set, HTML is parsed in the pool worker
+            processes instead of on the event loop.
+        checkpoint (CrawlCheckpoint | None): Position of the previous runs. When it has a
+            stop mark, pagination stops at the last stored article instead of at
+            the end of the time period, and an interrupted run resumes from its
+            last completed listing page.
+        dead_letters (list[DeadLetterSchema]): Articles that still failed with a transient
+            error after every retry, to be persisted and retried later.
     """
-    def __init__(self):
+    def __init__(
+        self,
+        max_concurrency: int = 10,
+        rate_per_host: float = 5.0,
+        client: httpx.AsyncClient | None = None,
+        cache: HttpCache | None = None,
+        known_urls: KnownUrlIndex | None = None,
+        extractor: Extractor | None = None,
+        parse_pool: ParsePool | None = None,
+        checkpoint: CrawlCheckpoint | None = None,
+    ):
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
@@ -42,9 +85,105 @@ class FinancialParser:
         }
         self.base_url = "https://www.ft.com"
         self.start_page = "/world"
+        self.section = "ft-world"
         self.post_list_link = []
         self.article_data = []
-    
+        self.scheduler = FetchScheduler(max_concurrency=max_concurrency, rate_per_host=rate_per_host)
+        self._client = client
+        self.cache = cache
+        self.known_urls = known_urls
+        self.skipped_known = 0
+        self.extractor = extractor or StrainedSoupExtractor()
+        self.parse_pool = parse_pool
+        self.checkpoint = checkpoint
+        self.dead_letters: list[DeadLetterSchema] = []
+
+    @classmethod
+    def from_section(cls, section: Section, shared_scheduler: bool = False, **kwargs) -> "FinancialParser":
+        """Create a parser crawling `section` with the scheduler and extractor of the section.
+
+        Args:
+            section (Section): The registry entry of the section.
+            shared_scheduler (bool): Use the scheduler of the section shared by every
+                parser on the running loop, see `get_shared_scheduler`, instead of a
+                new one. Must be called from a coroutine.
+            **kwargs: Other `FinancialParser` arguments, e.g. `cache` or `checkpoint`.
+        """
+        parser = cls(
+            max_concurrency=section.max_concurrency,
+            rate_per_host=section.rate_per_host,
+            extractor=get_extractor(section.extractor),
+            **kwargs,
+        )
+        parser.base_url = section.base_url
+        parser.start_page = section.listing_path
+        parser.section = section.name
+
+        if shared_scheduler:
+            parser.scheduler = get_shared_scheduler(section.name, section.max_concurrency, section.rate_per_host)
+
+        return parser
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            return get_http_client()
+
+        return self._client
+
+    async def __fetch(self, client, url, kind, conditional=True):
+        """Fetch a page through the scheduler, conditionally when it is cached.
+
+        Args:
+            client (httpx.AsyncClient): The HTTP client for making requests.
+            url (str): Absolute URL to fetch.
+            kind (str): "listing" or "article", the label of the fetch metrics.
+            conditional (bool): Send the cached validators of the page, if any.
+
+        Returns:
+            httpx.Response | None: The response, or None if the page answered
+                304 Not Modified and does not need to be parsed again.
+
+        Raises:
+            httpx.HTTPStatusError: If the page answered with an error status.
+        """
+        headers = self.headers
+
+        if self.cache is not None and conditional:
+            headers = {**self.headers, **self.cache.conditional_headers(url)}
+
+        with metrics.FETCH_LATENCY.labels(kind).time():
+            response = await self.scheduler.fetch(client, url, headers=headers)
+
+        metrics.BYTES_DOWNLOADED.labels(kind).inc(len(response.content))
+
+        if self.cache is not None and conditional and self.cache.record(url, response):
+            return None
+
+        response.raise_for_status()
+
+        return response
+
+    async def __extract_article(self, html):
+        if self.parse_pool is not None:
+            return await self.parse_pool.extract_article(html, backend=self.extractor.name)
+
+        start = time.process_time()
+        try:
+            return self.extractor.extract_article(html)
+        finally:
+            metrics.PARSE_CPU.labels("article").observe(time.process_time() - start)
+
+    async def __extract_listing(self, html):
+        if self.parse_pool is not None:
+            return await self.parse_pool.extract_listing(html, backend=self.extractor.name)
+
+        start = time.process_time()
+        try:
+            return self.extractor.extract_listing(html)
+        finally:
+            metrics.PARSE_CPU.labels("listing").observe(time.process_time() - start)
+
     async def __parsing_single_data(self, client, article_link) -> list[dict[str, str]]:
         """Parse a single article page to extract its details.
 
@@ -55,6 +194,7 @@ class FinancialParser:
         Returns:
             PostSchema | None: A PostSchema object containing article details, or None if
                 the article is paywalled or an error occurs.
+                Articles that failed with a transient error are added to `self.dead_letters`.
 
         Raises:
             httpx.TimeoutException: If the request times out.
@@ -63,81 +203,258 @@ class FinancialParser:
             Exception: For unexpected errors during parsing.
         """
         try:
-            req = await client.get(f"{self.base_url}{article_link}", headers=self.headers)
-
-            soup = BeautifulSoup(req.text, 'lxml')
+            req = await self.__fetch(client, f"{self.base_url}{article_link}", "article", conditional=False)
 
-            subscribe_el = soup.find("a", id="charge-button")
+            record = await self.__extract_article(req.text)
 
-            if subscribe_el:
+            if record is None:
+                self.__count("paywalled")
                 return None
 
-            header_el = soup.find('h1', class_='o-topper__headline')
-            subtitle_el = soup.find('div', class_='topper__standfirst')
-
-            authors_els = soup.find_all('a', attrs={"data-trackable": "author"})
-
-            article_el = soup.find('article', id="article-body")
-
-            article_time_el = soup.find('time', class_="article-info__timestamp o3-editorial-typography-byline-timestamp o-date")
-
-            date_val = article_time_el.get("datetime")
-
-            if '.' in date_val:
-                date_val = date_val.split('.')[0]
-            
             post = PostSchema(
                 url=f"{self.base_url}{article_link}",
-                author="".join([author.text for author in authors_els]),
-                title=header_el.text,
-                content=str(article_el),
-                published_at=datetime.strptime(date_val, '%Y-%m-%dT%H:%M:%S'),
-                scraped_at=datetime.utcnow()
+                scraped_at=datetime.utcnow(),
+                content_hash=content_hash(record["title"], record["content"]),
+                **record,
             )
 
-        
+            self.__count("parsed")
             return post
-        except httpx.TimeoutException:
+        except httpx.TimeoutException as e:
             logger.error(f"Timeout occurred while fetching {article_link}")
+            self.__dead_letter(article_link, e)
             return None
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error {e.response.status_code} for {article_link}: {e.response.text}")
+            self.__dead_letter(article_link, e)
             return None
         except httpx.RequestError as e:
             logger.error(f"Request error for {article_link}: {e}")
+            self.__dead_letter(article_link, e)
+            return None
+        except CircuitOpenError as e:
+            logger.error(f"Skipped {article_link}: {e}")
+            self.__dead_letter(article_link, e)
             return None
         except Exception as e:
             logger.exception(f"__parsing_single_data - Unexpected error for {article_link}: {e}")
+            self.__count("error")
             return None
 
 
+    def __store_validators(self, url, response):
+        if self.cache is None:
+            return None
+
+        return lambda: self.cache.store(url, response)
+
+
+    def __count(self, outcome):
+        metrics.ARTICLES.labels(self.section, outcome).inc()
+
+
+    def __dead_letter(self, article_link, error):
+        if is_transient(error):
+            self.dead_letters.append(DeadLetterSchema(url=f"{self.base_url}{article_link}", error=repr(error)))
+            self.__count("dead_letter")
+        else:
+            self.__count("error")
+
+
+    async def iter_post_data(self):
+        """Parse all collected article links, yielding each article as soon as it is ready.
+
+        Requests go through `self.scheduler`, so at most `max_concurrency` articles
+        are fetched at once and every host is rate limited.
+
+        Yields:
+            PostSchema: Parsed articles in completion order. Paywalled or failed
+                articles are skipped.
+        """
+        client = self.client
+        logger.info(f"Fetched: {len(self.post_list_link)} posts link")
+
+        results = self.scheduler.as_completed(
+            lambda article_link: self.__parsing_single_data(client, article_link),
+            self.post_list_link,
+        )
+
+        async for post in results:
+            if post is not None:
+                yield post
+
+
     async def pars_post_data(self):
         """Parse all collected article links and extract their details.
 
         This method processes the URLs in `self.post_list_link` concurrently,
-        storing valid results in `self.article_data`.
+        bounded by `self.scheduler`, storing valid results in `self.article_data`.
 
         Returns:
             list[PostSchema]: A list of PostSchema objects containing article details.
+        """
+        self.article_data = [post async for post in self.iter_post_data()]
+
+        return self.article_data
+
+
+    async def __iter_listing_links(self, client, period: timedelta):
+        """Paginate through the listing and yield article links page by page.
+
+        The next listing page is only requested once the consumer has taken every
+        link of the current one, so a slow consumer naturally pauses pagination.
+        Links already present in `self.known_urls` are not yielded. With a
+        checkpoint, pagination starts at its resume page and stops at its stop
+        mark, `period` only bounds the very first run of a section. The resume
+        page is always fetched unconditionally, and with a checkpoint the
+        validators of a listing page are only cached once the checkpoint has
+        been saved past it.
+
+        Args:
+            client (httpx.AsyncClient): The HTTP client for making requests.
+            period (timedelta): The time period for filtering recent articles.
+
+        Yields:
+            tuple: The relative URL of each new article (e.g., '/content/123') and
+                the checkpoint `ListingPage` it belongs to, or None without a checkpoint.
+        """
+        checkpoint = self.checkpoint
+        is_parsing = True
+        next_page = ""
+
+        if checkpoint is not None and checkpoint.resume_page:
+            next_page = checkpoint.resume_page
+
+        # a resumed page may hold articles the crashed run never wrote, a 304 must not skip them
+        conditional = not next_page
+
+        while is_parsing:
+            page_url = f"{self.base_url}{self.start_page}{next_page}"
+
+            req = await self.__fetch(client, page_url, "listing", conditional)
+            conditional = True
+
+            if req is None:
+                logger.info(f"Listing page {page_url} not modified, stop pagination")
+                break
+
+            teasers, next_page = await self.__extract_listing(req.text)
+            metrics.LISTING_PAGES.labels(self.section).inc()
+            page = checkpoint.open_page() if checkpoint is not None else None
+
+            for href, date_val in teasers:
+                if href is None or date_val is None:
+                    continue
+
+                if not self.__is_new_article(href, date_val, period):
+                    is_parsing = False
+                    break
+
+                if self.known_urls is not None and f"{self.base_url}{href}" in self.known_urls:
+                    self.skipped_known += 1
+                    self.__count("known")
+                    continue
+
+                if page is not None:
+                    page.pending += 1
+
+                metrics.LINKS_FOUND.labels(self.section).inc()
+                yield href, page
+
+            if page is not None:
+                # the validators are only stored once the articles of the page are written
+                checkpoint.close_page(page, next_page, on_saved=self.__store_validators(page_url, req))
+            elif self.cache is not None:
+                self.cache.store(page_url, req)
+
+            if not next_page:
+                break
+
+
+    def listing_page_url(self, number: int) -> str:
+        """Absolute URL of the listing page `number`, counting from 1."""
+        if number <= 1:
+            return f"{self.base_url}{self.start_page}"
+
+        return f"{self.base_url}{self.start_page}?page={number}"
+
+
+    async def probe_listing_page(self, number: int) -> list[datetime]:
+        """Publication dates of the teasers of the listing page `number`.
+
+        The page is always requested unconditionally. A page past the end of the
+        listing answers 404 or lists no teaser, and gives an empty list.
 
         Raises:
-            httpx.TimeoutException: If a request times out.
-            httpx.HTTPStatusError: If an HTTP error occurs.
-            httpx.RequestError: If a network error occurs.
+            httpx.HTTPStatusError: If the page answered with another error status.
         """
-        async with httpx.AsyncClient(timeout=httpx.Timeout(20.0, connect=5.0)) as client:
-            logger.info(f"Fetched: {len(self.post_list_link)} posts link")
-            tasks = []
+        response = await self.scheduler.fetch(self.client, self.listing_page_url(number), headers=self.headers)
+
+        if response.status_code == 404:
+            return []
+
+        response.raise_for_status()
+
+        teasers, _ = await self.__extract_listing(response.text)
+        dates = []
 
-            for article_link in self.post_list_link:
-                tasks.append(self.__parsing_single_data(client, article_link))
+        for href, date_val in teasers:
+            if href is None or date_val is None:
+                continue
 
-            
-            res = await asyncio.gather(*tasks)
+            try:
+                dates.append(parse_datetime(date_val))
+            except ValueError:
+                continue
 
-            self.article_data = [data for data in res if data is not None]
+        return dates
 
-            return self.article_data
+
+    async def __iter_page_range_links(self, client, pages, start, end, on_page):
+        """Yield the links of the articles published in `[start, end)` on the listing pages `pages`."""
+        for number in pages:
+            page_url = self.listing_page_url(number)
+
+            req = await self.__fetch(client, page_url, "listing")
+
+            if req is None:
+                logger.info(f"Listing page {page_url} not modified, skipped")
+                continue
+
+            teasers, next_page = await self.__extract_listing(req.text)
+            metrics.LISTING_PAGES.labels(self.section).inc()
+            reached_start = False
+
+            for href, date_val in teasers:
+                if href is None or date_val is None:
+                    continue
+
+                try:
+                    published_at = parse_datetime(date_val)
+                except ValueError:
+                    logger.warning(f"Invalid datetime format for {href}: {date_val}")
+                    continue
+
+                if published_at >= end:
+                    continue
+
+                if published_at < start:
+                    reached_start = True
+                    break
+
+                if self.known_urls is not None and f"{self.base_url}{href}" in self.known_urls:
+                    self.skipped_known += 1
+                    self.__count("known")
+                    continue
+
+                metrics.LINKS_FOUND.labels(self.section).inc()
+                yield href, None
+
+            if on_page is not None:
+                on_page(number)
+
+            if reached_start or not next_page:
+                return
 
 
     async def parsing(self, period: timedelta):
@@ -153,84 +470,182 @@ class FinancialParser:
             httpx.RequestError: If a network error occurs during pagination.
             Exception: For unexpected errors during parsing or pagination.
         """
-        is_parsing = True
-        next_page = ""
-        async with httpx.AsyncClient() as client:
-            while is_parsing:
-                if next_page:
-                    req = await client.get(f"{self.base_url}{self.start_page}{next_page}", headers=self.headers)
-                else:
-                    req = await client.get(f"{self.base_url}{self.start_page}", headers=self.headers)
+        async for link, _ in self.__iter_listing_links(self.client, period):
+            self.post_list_link.append(link)
 
-                soup = BeautifulSoup(req.text, "lxml")
-            
-                posts = soup.find_all('li', class_="o-teaser-collection__item o-grid-row")
 
-                for post in posts:
-                    if not post:
-                        continue
+    async def iter_crawl(self, period: timedelta, queue_size: int = 100):
+        """Crawl the listing and the articles at the same time, yielding parsed articles.
 
-                    try:
-                        if not self.__is_recent_article(post, period):
-                            is_parsing = False
-                            break
-                    except Exception as e:
-                        continue
+        The listing is walked down to the checkpoint or the end of `period` while
+        the articles found so far are fetched, see `__pipeline`. With a checkpoint,
+        the checkpoint is finished when the crawl ends without an error.
 
-                    a = post.find('a', attrs={"data-trackable":"heading-link"})
+        Args:
+            period (timedelta): The time period for filtering recent articles.
+            queue_size (int): Maximum number of links and of parsed articles buffered
+                between stages.
 
-                    self.post_list_link.append(a.get("href"))
+        Yields:
+            PostSchema: Parsed articles in completion order. Paywalled or failed
+                articles are skipped.
 
-                try:
-                    pagination = soup.find("div", class_="stream__pagination")
+        Raises:
+            httpx.RequestError: If a network error occurs during pagination.
+        """
+        async for post in self.__pipeline(self.__iter_listing_links(self.client, period), queue_size):
+            yield post
 
-                    pag_a = pagination.find('a', attrs={'data-trackable': 'next-page'})
+        if self.checkpoint is not None:
+            self.checkpoint.finish()
 
-                    if not pag_a:
-                        is_parsing = False
-                        break
-                    
-                    next_page = pag_a.get("href")
-                except Exception as e:
-                    logger.error(f"parsing - Error: {e}")
-                    break
 
+    async def iter_backfill(self, pages: range, start: datetime, end: datetime, queue_size: int = 100,
+                            on_page=None):
+        """Crawl the listing pages `pages` and the articles published in `[start, end)` on them.
 
-        
-    def __is_recent_article(self, post, period):
-        """Check if an article's publication date is within the specified time period.
+        Listing pages are requested by number, so several parsers can crawl
+        disjoint page ranges of the same section at once. Pages are walked in
+        order and the crawl stops at the first teaser older than `start`. The
+        checkpoint, if any, is left untouched.
 
         Args:
-            post (BeautifulSoup): The BeautifulSoup element representing an article teaser.
-            period (timedelta): The time period to check against (e.g., 30 days).
+            pages (range): Listing page numbers to crawl, newest first.
+            start (datetime): Oldest publication date to crawl, inclusive.
+            end (datetime): Newest publication date to crawl, exclusive.
+            queue_size (int): Maximum number of links and of parsed articles buffered
+                between stages.
+            on_page (Callable | None): Called with the page number once the links of
+                a page have been queued.
+
+        Yields:
+            PostSchema: Parsed articles in completion order.
+        """
+        links = self.__iter_page_range_links(self.client, pages, start, end, on_page)
 
-        Returns:
-            bool: True if the article is within the time period, False otherwise.
+        async for post in self.__pipeline(links, queue_size):
+            yield post
 
-        Raises:
-            ValueError: If the publication date cannot be parsed.
-        """
-        time = post.find('time', class_='o3-type-label o-date')
 
-        date_val = time.get("datetime")
+    async def __pipeline(self, link_source, queue_size):
+        """Fetch and parse the `(link, page)` pairs of `link_source` with `max_concurrency` workers.
+
+        A producer puts every link on a bounded queue that the workers drain while
+        the next listing page is being fetched. Parsed articles go through a second
+        bounded queue to the caller. When either queue is full the stage feeding
+        it waits, so memory stays flat no matter how deep the crawl goes. A link
+        counts as done for its checkpoint page once its result has been handed
+        to the caller.
+        """
+        links: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        results: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        workers_count = self.scheduler.max_concurrency
+        done = object()
+
+        client = self.client
+
+        async def produce():
+            try:
+                async for link, page in link_source:
+                    self.post_list_link.append(link)
+                    await links.put((link, page))
+            finally:
+                if not asyncio.current_task().cancelling():
+                    for _ in range(workers_count):
+                        await links.put(done)
+
+        async def work():
+            try:
+                while (item := await links.get()) is not done:
+                    link, page = item
+                    await results.put((await self.__parsing_single_data(client, link), page))
+            finally:
+                if not asyncio.current_task().cancelling():
+                    await results.put(done)
+
+        producer = asyncio.create_task(produce())
+        workers = [asyncio.create_task(work()) for _ in range(workers_count)]
 
         try:
-            if '.' in date_val:
-                date_val = date_val.split('.')[0]
-            
-            publish_date = datetime.strptime(date_val, '%Y-%m-%dT%H:%M:%S')
+            finished = 0
+            while finished < workers_count:
+                item = await results.get()
 
-            current_date = datetime.utcnow()
+                if item is done:
+                    finished += 1
+                    continue
 
-            thirty_days_ago = current_date - period
-            
-            
+                post, page = item
 
-            if publish_date > thirty_days_ago:
-                return True
-            else:
-                return False
+                if page is not None:
+                    page.pending -= 1
+
+                if post is not None:
+                    yield post
+
+            await producer
+        finally:
+            for task in (producer, *workers):
+                task.cancel()
+
+            await asyncio.gather(producer, *workers, return_exceptions=True)
+
+
+    async def crawl(self, period: timedelta):
+        """Crawl the listing and parse the articles as one pipelined run.
+
+        Args:
+            period (timedelta): The time period for filtering recent articles.
+
+        Returns:
+            list[PostSchema]: A list of PostSchema objects containing article details.
+        """
+        self.article_data = [post async for post in self.iter_crawl(period)]
+
+        return self.article_data
+
+
+    def __is_new_article(self, href, date_val, period):
+        """Check if a teaser is newer than the checkpoint, or within `period` without one.
+
+        The first teaser that passes is recorded as the newest article of the run.
+
+        Args:
+            href (str): The relative URL of the article teaser.
+            date_val (str): The `datetime` attribute of the article teaser.
+            period (timedelta): The time period to check against when there is no stop mark.
 
+        Returns:
+            bool: True if the article has to be crawled, False once pagination must
+                stop or if the publication date cannot be parsed.
+        """
+        try:
+            publish_date = parse_datetime(date_val)
         except ValueError:
             return False
-    
\ No newline at end of file
+
+        checkpoint = self.checkpoint
+
+        if checkpoint is not None and checkpoint.has_mark:
+            if checkpoint.reached(f"{self.base_url}{href}", publish_date):
+                return False
+        elif not self.__is_recent_article(publish_date, period):
+            return False
+
+        if checkpoint is not None:
+            checkpoint.see(f"{self.base_url}{href}", publish_date)
+
+        return True
+
+
+    def __is_recent_article(self, publish_date, period):
+        """Check if an article's publication date is within the specified time period.
+
+        Args:
+            publish_date (datetime): The publication date of the article teaser.
+            period (timedelta): The time period to check against (e.g., 30 days).
+
+        Returns:
+            bool: True if the article is within the time period, False otherwise.
+        """
+        return publish_date > datetime.utcnow() - period
@@ -0,0 +1,122 @@
+import time
+import sqlite3
+import logging
+import threading
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class HttpCache:
+    """An on-disk store of HTTP validators used to make conditional requests.
+
+    For every URL the cache keeps the `ETag` and `Last-Modified` values of the last
+    successfully parsed response. They are sent back as `If-None-Match` and
+    `If-Modified-Since`, so a page that has not changed answers with a bodyless
+    304 and its parsing can be skipped. Entries live in a SQLite file and the
+    least recently used ones are evicted once `max_entries` is exceeded.
+
+    Attributes:
+        path (str): Location of the SQLite file (":memory:" keeps it in memory).
+        max_entries (int): Maximum number of URLs kept in the cache.
+        hits (int): Requests answered with 304 Not Modified.
+        misses (int): Requests that returned a full body.
+    """
+    def __init__(self, path: str, max_entries: int = 50_000):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS http_cache ("
+            "url TEXT PRIMARY KEY, "
+            "etag TEXT, "
+            "last_modified TEXT, "
+            "accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_http_cache_accessed_at ON http_cache (accessed_at)")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT count(*) FROM http_cache").fetchone()[0]
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """Return the conditional request headers for `url`, empty if it is not cached."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified FROM http_cache WHERE url = ?", (url,)
+            ).fetchone()
+
+        if row is None:
+            return {}
+
+        etag, last_modified = row
+        headers = {}
+
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        return headers
+
+    def record(self, url: str, response: httpx.Response) -> bool:
+        """Count a response and refresh its LRU position.
+
+        Returns:
+            bool: True if the response is a 304 and the cached copy is still valid.
+        """
+        if response.status_code == 304:
+            self.hits += 1
+
+            with self._lock:
+                self._conn.execute("UPDATE http_cache SET accessed_at = ? WHERE url = ?", (time.time(), url))
+
+            return True
+
+        self.misses += 1
+        return False
+
+    def store(self, url: str, response: httpx.Response):
+        """Save the validators of a successfully parsed response."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+
+        if not etag and not last_modified:
+            return
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO http_cache (url, etag, last_modified, accessed_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (url) DO UPDATE SET etag = excluded.etag, "
+                "last_modified = excluded.last_modified, accessed_at = excluded.accessed_at",
+                (url, etag, last_modified, time.time()),
+            )
+            self._evict()
+
+    def _evict(self):
+        overflow = self._conn.execute("SELECT count(*) FROM http_cache").fetchone()[0] - self.max_entries
+
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM http_cache WHERE url IN "
+                "(SELECT url FROM http_cache ORDER BY accessed_at LIMIT ?)",
+                (overflow,),
+            )
+
+    @property
+    def stats(self) -> dict[str, int | float]:
+        total = self.hits + self.misses
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": len(self),
+        }
+
+    def close(self):
+        self._conn.close()
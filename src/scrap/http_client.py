@@ -0,0 +1,70 @@
+import os
+import asyncio
+import logging
+import weakref
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+HTTP_TIMEOUT = httpx.Timeout(20.0, connect=5.0)
+
+HTTP_LIMITS = httpx.Limits(
+    max_connections=int(os.getenv("HTTP_MAX_CONNECTIONS", 20)),
+    max_keepalive_connections=int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", 10)),
+    keepalive_expiry=float(os.getenv("HTTP_KEEPALIVE_EXPIRY", 120)),
+)
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def create_http_client(**kwargs) -> httpx.AsyncClient:
+    """Create an HTTP/2 client with the scraper timeout and keep-alive limits."""
+    kwargs.setdefault("http2", True)
+    kwargs.setdefault("timeout", HTTP_TIMEOUT)
+    kwargs.setdefault("limits", HTTP_LIMITS)
+
+    return httpx.AsyncClient(**kwargs)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide client bound to the running event loop.
+
+    httpx connections belong to the loop they were opened on, so one client is
+    kept per loop. Within a loop every parser and every task run shares the same
+    connection pool and its warm TLS/HTTP/2 connections.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+
+    if client is None or client.is_closed:
+        client = create_http_client()
+        _clients[loop] = client
+
+    return client
+
+
+async def close_http_client():
+    """Close the client bound to the running event loop, if any."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+def shutdown_http_clients(timeout: float = 10.0):
+    """Close every shared client from synchronous code, e.g. a worker shutdown hook."""
+    for loop, client in list(_clients.items()):
+        _clients.pop(loop, None)
+
+        if client.is_closed or loop.is_closed():
+            continue
+
+        try:
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop).result(timeout)
+            else:
+                loop.run_until_complete(client.aclose())
+        except Exception as e:
+            logger.error(f"Failed to close HTTP client: {e}")
@@ -0,0 +1,62 @@
+"""Prometheus metrics of the crawl, the parser pool and the database writes.
+
+The metrics live in the default registry of each process. The FastAPI app serves
+them at `/metrics` and the Celery worker on `CELERY_METRICS_PORT`.
+"""
+import os
+import logging
+
+from prometheus_client import Counter, Gauge, Histogram, start_http_server
+
+logger = logging.getLogger(__name__)
+
+
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+PARSE_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+
+LISTING_PAGES = Counter(
+    "scraper_listing_pages_total", "Listing pages fetched", ["section"])
+
+LINKS_FOUND = Counter(
+    "scraper_links_found_total", "New article links found on listing pages", ["section"])
+
+ARTICLES = Counter(
+    "scraper_articles_total", "Article outcomes: parsed, paywalled, known, error, dead_letter",
+    ["section", "outcome"])
+
+FETCH_LATENCY = Histogram(
+    "scraper_fetch_seconds", "Latency of a fetch including retries", ["kind"], buckets=LATENCY_BUCKETS)
+
+FETCH_RATE = Gauge(
+    "scraper_fetch_rate", "Requests per second an adaptive scheduler allows for a host", ["host"])
+
+BYTES_DOWNLOADED = Counter(
+    "scraper_downloaded_bytes_total", "Decoded bytes of fetched pages", ["kind"])
+
+PARSE_CPU = Histogram(
+    "scraper_parse_cpu_seconds", "CPU time spent extracting one page", ["kind"], buckets=PARSE_BUCKETS)
+
+DB_WRITE_LATENCY = Histogram(
+    "scraper_db_write_seconds", "Latency of one bulk upsert chunk, commit included", buckets=LATENCY_BUCKETS)
+
+DB_ROWS = Counter(
+    "scraper_db_rows_total", "Posts written by bulk upserts", ["result"])
+
+TASK_DURATION = Histogram(
+    "scraper_task_seconds", "Duration of crawl tasks", ["task"],
+    buckets=(1, 5, 15, 30, 60, 120, 300, 600, 1800, 3600))
+
+
+def start_metrics_server(port: int | None = None):
+    """Serve the metrics of this process over HTTP, on `CELERY_METRICS_PORT` (9100) by default."""
+    port = port or int(os.getenv("CELERY_METRICS_PORT", 9100))
+
+    try:
+        start_http_server(port)
+    except OSError as e:
+        logger.error(f"Metrics server not started on port {port}: {e}")
+        return
+
+    logger.info(f"Metrics served on port {port}")
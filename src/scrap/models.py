@@ -1,4 +1,6 @@
-from sqlalchemy import Column, String, Text, Integer, DateTime
+from sqlalchemy import Column, String, Text, Integer, DateTime, Index, ForeignKey, LargeBinary
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred
 
 from src.database import Base
 
@@ -13,5 +15,66 @@ class Post(Base):
     author = Column(String(126), nullable=False)
     published_at = Column(DateTime, nullable=False)
     scraped_at = Column(DateTime, nullable=False)
+    content_hash = Column(String(64), nullable=True)
+    search_vector = deferred(Column(TSVECTOR, nullable=True))
 
+    __table_args__ = (
+        Index('ix_posts_published_at_id', 'published_at', 'id'),
+        Index('ix_posts_author_published_at_id', 'author', 'published_at', 'id'),
+        Index('ix_posts_search_vector', 'search_vector', postgresql_using='gin'),
+    )
 
+
+class PostHtml(Base):
+    """The original `<article>` markup of a post, zstd-compressed and only read on demand."""
+    __tablename__ = 'post_html'
+
+    post_id = Column(Integer, ForeignKey('posts.id', ondelete='CASCADE'), primary_key=True)
+    html_zstd = Column(LargeBinary, nullable=False)
+    raw_size = Column(Integer, nullable=False)
+
+
+class PostRevision(Base):
+    """A change of the title or body of a stored post, recorded by its content hashes."""
+    __tablename__ = 'post_revisions'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    post_id = Column(Integer, ForeignKey('posts.id', ondelete='CASCADE'), nullable=False)
+    previous_hash = Column(String(64), nullable=True)
+    content_hash = Column(String(64), nullable=False)
+    content_size = Column(Integer, nullable=False)
+    revised_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index('ix_post_revisions_post_id_revised_at', 'post_id', 'revised_at'),
+    )
+
+
+class CrawlCheckpoint(Base):
+    """Where the crawl of a listing section stopped, see `src.scrap.checkpoint`."""
+    __tablename__ = 'crawl_checkpoints'
+
+    section = Column(String(126), primary_key=True)
+    last_url = Column(String(164), nullable=True)
+    last_published_at = Column(DateTime, nullable=True)
+    resume_page = Column(String(164), nullable=True)
+    run_url = Column(String(164), nullable=True)
+    run_published_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, nullable=False)
+
+
+class DeadLetter(Base):
+    """An article URL that kept failing with transient errors, retried in bulk later."""
+    __tablename__ = 'dead_letters'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    url = Column(String(164), nullable=False, unique=True)
+    section = Column(String(126), nullable=True)
+    error = Column(Text, nullable=False)
+    attempts = Column(Integer, nullable=False, default=1)
+    first_failed_at = Column(DateTime, nullable=False)
+    last_failed_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index('ix_dead_letters_last_failed_at', 'last_failed_at'),
+    )
@@ -0,0 +1,132 @@
+import os
+import time
+import asyncio
+import logging
+
+from concurrent.futures import ProcessPoolExecutor
+
+from src.scrap.extractors import Extractor, get_extractor
+from src.scrap import metrics
+
+logger = logging.getLogger(__name__)
+
+
+_extractors: dict[str, Extractor] = {}
+
+
+def _extract(backend: str, kind: str, html: str):
+    """Runs inside a pool process, reusing one extractor per backend.
+
+    Returns the record together with the CPU time the worker spent on it.
+    """
+    extractor = _extractors.get(backend)
+
+    if extractor is None:
+        extractor = _extractors[backend] = get_extractor(backend)
+
+    start = time.process_time()
+
+    if kind == "article":
+        record = extractor.extract_article(html)
+    else:
+        record = extractor.extract_listing(html)
+
+    return record, time.process_time() - start
+
+
+class ParsePool:
+    """Runs HTML extraction in worker processes so the event loop never blocks on parsing.
+
+    Only the raw HTML goes to the pool and only the compact record produced by the
+    extractor comes back. The pool keeps simple metrics: how many pages are queued
+    or being parsed, and the latency of each parse as seen from the event loop
+    (queueing included).
+
+    Attributes:
+        max_workers (int): Number of worker processes.
+        backend (str): Name of the extractor backend used in the workers when a
+            call does not name one.
+        pending (int): Pages submitted and not yet parsed (the queue depth).
+        parsed (int): Pages parsed so far.
+        total_latency (float): Sum of parse latencies in seconds.
+        max_latency (float): Slowest parse latency in seconds.
+    """
+    def __init__(self, max_workers: int | None = None, backend: str = "strained"):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.backend = backend
+        self.pending = 0
+        self.parsed = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self._executor: ProcessPoolExecutor | None = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+
+        return self._executor
+
+    async def _submit(self, kind: str, html: str, backend: str | None):
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        self.pending += 1
+
+        try:
+            record, cpu = await loop.run_in_executor(self.executor, _extract, backend or self.backend, kind, html)
+            metrics.PARSE_CPU.labels(kind).observe(cpu)
+
+            return record
+        finally:
+            latency = time.perf_counter() - start
+            self.pending -= 1
+            self.parsed += 1
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+
+    async def extract_article(self, html: str, backend: str | None = None) -> dict | None:
+        return await self._submit("article", html, backend)
+
+    async def extract_listing(self, html: str, backend: str | None = None) -> tuple[list[tuple[str | None, str | None]], str | None]:
+        return await self._submit("listing", html, backend)
+
+    @property
+    def stats(self) -> dict[str, int | float]:
+        return {
+            "workers": self.max_workers,
+            "queue_depth": self.pending,
+            "parsed": self.parsed,
+            "avg_latency": self.total_latency / self.parsed if self.parsed else 0.0,
+            "max_latency": self.max_latency,
+        }
+
+    def shutdown(self, wait: bool = True):
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+
+_parse_pool: ParsePool | None = None
+
+
+def get_parse_pool() -> ParsePool:
+    """Return the process-wide pool shared by every task run in a Celery worker.
+
+    The pool size is read from `PARSE_POOL_WORKERS` and defaults to the CPU count.
+    """
+    global _parse_pool
+
+    if _parse_pool is None:
+        workers = os.getenv("PARSE_POOL_WORKERS")
+        _parse_pool = ParsePool(max_workers=int(workers) if workers else None)
+
+    return _parse_pool
+
+
+def shutdown_parse_pool():
+    global _parse_pool
+
+    if _parse_pool is not None:
+        logger.info(f"Shutting down parse pool: {_parse_pool.stats}")
+        _parse_pool.shutdown()
+        _parse_pool = None
@@ -0,0 +1,214 @@
+import os
+import time
+import asyncio
+import logging
+import weakref
+
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from urllib.parse import urlencode
+
+import redis.asyncio as redis
+from fastapi import Request, Response
+
+logger = logging.getLogger(__name__)
+
+
+VERSION_KEY = "financial:posts:version"
+KEY_PREFIX = "financial:response"
+
+
+class LRUCache:
+    """A bounded in-process LRU whose entries expire after `ttl` seconds.
+
+    Attributes:
+        max_entries (int): Maximum number of entries kept.
+        ttl (float): Lifetime of an entry in seconds.
+    """
+    def __init__(self, max_entries: int = 1024, ttl: float = 30.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: bytes):
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+
+class ResponseCache:
+    """A read-through cache of serialized API responses.
+
+    Responses are stored in Redis under a key made of the request path, its sorted
+    query parameters and the current posts version. Writing posts bumps the version
+    with `invalidate`, so every cached page becomes unreachable at once and the old
+    keys simply expire. When Redis is not configured or not reachable the cache
+    falls back to an in-process LRU with a short TTL, because invalidations made
+    by the Celery workers cannot reach it.
+
+    Attributes:
+        redis_url (str | None): Redis connection URL, None to only use the LRU.
+        ttl (int): Lifetime of a Redis entry in seconds.
+        local (LRUCache): The in-process fallback.
+        retry_after (float): Seconds Redis is skipped after a failure.
+        hits (int): Responses served from the cache.
+        misses (int): Responses that had to be built.
+        errors (int): Failed Redis calls.
+    """
+    def __init__(self, redis_url: str | None = None, ttl: int = 300, max_entries: int = 1024,
+                 fallback_ttl: float = 30.0, retry_after: float = 5.0):
+        self.redis_url = redis_url
+        self.ttl = ttl
+        self.local = LRUCache(max_entries, fallback_ttl)
+        self.retry_after = retry_after
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.hit_latency = 0.0
+        self.miss_latency = 0.0
+        self._redis_down_until = 0.0
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, redis.Redis]" = weakref.WeakKeyDictionary()
+
+    def _redis(self) -> redis.Redis | None:
+        """Return the Redis client bound to the running loop, None while Redis is unavailable."""
+        if not self._redis_available:
+            return None
+
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+
+        if client is None:
+            client = redis.from_url(self.redis_url, socket_connect_timeout=0.5, socket_timeout=0.5)
+            self._clients[loop] = client
+
+        return client
+
+    def _redis_failed(self, e: Exception):
+        self.errors += 1
+        self._redis_down_until = time.monotonic() + self.retry_after
+        logger.warning(f"Response cache falls back to memory: {e}")
+
+    @staticmethod
+    def key(request: Request) -> str:
+        query = urlencode(sorted(request.query_params.multi_items()))
+
+        return f"{request.url.path}?{query}"
+
+    async def _version(self, client: redis.Redis) -> int:
+        version = await client.get(VERSION_KEY)
+
+        return int(version) if version is not None else 0
+
+    async def get_or_set(self, key: str, produce: Callable[[], Awaitable[bytes]]) -> tuple[bytes, bool]:
+        """Return the cached value of `key`, building and storing it on a miss.
+
+        Returns:
+            tuple: The value and whether it came from the cache.
+        """
+        start = time.perf_counter()
+        client = self._redis()
+        redis_key = None
+
+        if client is not None:
+            try:
+                redis_key = f"{KEY_PREFIX}:{await self._version(client)}:{key}"
+                value = await client.get(redis_key)
+            except Exception as e:
+                self._redis_failed(e)
+                client = None
+
+        if client is None:
+            value = self.local.get(key)
+
+        if value is not None:
+            self.hits += 1
+            self.hit_latency += time.perf_counter() - start
+            return value, True
+
+        value = await produce()
+
+        if client is not None:
+            try:
+                await client.set(redis_key, value, ex=self.ttl)
+            except Exception as e:
+                self._redis_failed(e)
+        else:
+            self.local.set(key, value)
+
+        self.misses += 1
+        self.miss_latency += time.perf_counter() - start
+        return value, False
+
+    async def respond(self, request: Request, produce: Callable[[], Awaitable[bytes]]) -> Response:
+        """Serve the JSON response of `request` from the cache, marking it with an `X-Cache` header."""
+        value, hit = await self.get_or_set(self.key(request), produce)
+
+        return Response(
+            content=value,
+            media_type="application/json",
+            headers={"X-Cache": "HIT" if hit else "MISS"},
+        )
+
+    async def invalidate(self):
+        """Make every cached response stale. Never raises, a failed bump only logs."""
+        self.local.clear()
+
+        client = self._redis()
+
+        if client is None:
+            return
+
+        try:
+            await client.incr(VERSION_KEY)
+        except Exception as e:
+            self._redis_failed(e)
+
+    @property
+    def stats(self) -> dict[str, int | float | str]:
+        total = self.hits + self.misses
+
+        return {
+            "backend": "redis" if self._redis_available else "memory",
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "avg_hit_latency": self.hit_latency / self.hits if self.hits else 0.0,
+            "avg_miss_latency": self.miss_latency / self.misses if self.misses else 0.0,
+            "errors": self.errors,
+            "local_entries": len(self.local),
+        }
+
+    @property
+    def _redis_available(self) -> bool:
+        return self.redis_url is not None and time.monotonic() >= self._redis_down_until
+
+
+response_cache = ResponseCache(
+    redis_url=os.getenv("REDIS_URL"),
+    ttl=int(os.getenv("RESPONSE_CACHE_TTL", 300)),
+    max_entries=int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", 1024)),
+    fallback_ttl=float(os.getenv("RESPONSE_CACHE_FALLBACK_TTL", 30)),
+)
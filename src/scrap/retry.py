@@ -0,0 +1,150 @@
+import time
+import random
+import logging
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to a host whose circuit is open."""
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"Circuit open for {host}, retry in {retry_in:.1f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+def is_transient(exc: Exception) -> bool:
+    """Whether a failed request may succeed later: network errors, timeouts, 429 and 5xx."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRY_STATUSES
+
+    return isinstance(exc, (httpx.TimeoutException, httpx.RequestError, CircuitOpenError))
+
+
+def retry_after(response: httpx.Response | None) -> float | None:
+    """Seconds to wait from the `Retry-After` header of a 429 or 503 response, if it has one."""
+    if response is None or response.status_code not in (429, 503):
+        return None
+
+    value = response.headers.get("Retry-After")
+
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter for transient request failures.
+
+    Attempt `n` (from 0) waits a random time between 0 and `base_delay * 2**n`,
+    capped at `max_delay`. A `Retry-After` header replaces the random delay, also
+    capped at `max_delay`.
+
+    Attributes:
+        max_attempts (int): Requests sent for one URL before giving up.
+        base_delay (float): Backoff of the first retry in seconds.
+        max_delay (float): Longest wait between two attempts in seconds.
+    """
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.5, max_delay: float = 30.0):
+        if max_attempts < 1:
+            raise ValueError("RetryPolicy max_attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt: int, response: httpx.Response | None = None) -> float:
+        after = retry_after(response)
+
+        if after is not None:
+            return min(after, self.max_delay)
+
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """Stops sending requests to a host after consecutive transient failures.
+
+    After `failure_threshold` failures in a row the circuit of the host opens and
+    requests fail fast with `CircuitOpenError` for `reset_timeout` seconds. Then
+    the circuit is half-open: exactly one trial request is let through and every
+    other request keeps failing fast until the trial resolves. Its success closes
+    the circuit and its failure opens it again. A trial that never reports back,
+    e.g. because it was cancelled, is replaced after another `reset_timeout`.
+
+    Attributes:
+        failure_threshold (int): Consecutive failures that open the circuit.
+        reset_timeout (float): Seconds the circuit stays open.
+    """
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures: dict[str, int] = {}
+        self._opened_at: dict[str, float] = {}
+        self._trial_at: dict[str, float] = {}
+
+    def is_open(self, host: str) -> bool:
+        return host in self._opened_at
+
+    def is_half_open(self, host: str) -> bool:
+        return host in self._trial_at
+
+    def check(self, host: str):
+        """Raise `CircuitOpenError` while the circuit of `host` is open or its trial is in flight."""
+        now = time.monotonic()
+        trial_at = self._trial_at.get(host)
+
+        if trial_at is not None:
+            retry_in = trial_at + self.reset_timeout - now
+
+            if retry_in > 0:
+                raise CircuitOpenError(host, retry_in)
+
+            logger.warning(f"Trial request to {host} did not report back, sending another one")
+            self._trial_at[host] = now
+            return
+
+        opened_at = self._opened_at.get(host)
+
+        if opened_at is None:
+            return
+
+        retry_in = opened_at + self.reset_timeout - now
+
+        if retry_in > 0:
+            raise CircuitOpenError(host, retry_in)
+
+        # half-open: this request is the trial, the next ones fail fast until it resolves
+        del self._opened_at[host]
+        self._trial_at[host] = now
+        self._failures[host] = self.failure_threshold - 1
+
+    def record_success(self, host: str):
+        self._failures.pop(host, None)
+        self._trial_at.pop(host, None)
+
+    def record_failure(self, host: str):
+        failures = self._failures.get(host, 0) + 1
+        self._failures[host] = failures
+        self._trial_at.pop(host, None)
+
+        if failures >= self.failure_threshold and host not in self._opened_at:
+            self._opened_at[host] = time.monotonic()
+            logger.warning(f"Circuit opened for {host} after {failures} consecutive failures")
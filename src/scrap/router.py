@@ -1,20 +1,101 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Path, Request
+from fastapi.responses import HTMLResponse
 from fastapi_pagination import Page, paginate 
 from fastapi_pagination.ext.sqlalchemy import paginate as sqlalchemy_paginate
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.database import get_db_session
-from src.scrap.schemas import PostSchema
+from src.database import get_db_session, async_session_manager
+from src.scrap.schemas import PostSchema, PostSummarySchema, PostSearchResultSchema, PostRevisionSchema, PostCursorPage
+from src.scrap.response_cache import response_cache
 
-from src.scrap.dependencies import valid_list_post, valid_all_post_query
+from src.scrap.dependencies import valid_list_post, valid_all_post_query, valid_post_page_query, valid_post, valid_post_html, valid_post_revisions, valid_search_query
 
 scrap = APIRouter(prefix="/financial")
 
+STORED_HTML_HEADERS = {
+    "Content-Security-Policy": "sandbox",
+    "X-Content-Type-Options": "nosniff",
+}
+
 
 
 @scrap.get("/post-list",
-    response_model=Page[PostSchema],
+    response_model=Page[PostSummarySchema],
+    status_code=200
+)
+async def get_list_post(request: Request, query = Depends(valid_all_post_query), db: AsyncSession = Depends(get_db_session)):
+    async def produce():
+        page = await sqlalchemy_paginate(db, query)
+        return page.model_dump_json().encode()
+
+    return await response_cache.respond(request, produce)
+
+
+@scrap.get("/posts",
+    response_model=PostCursorPage[PostSummarySchema],
+    status_code=200
+)
+async def get_post_page(request: Request, query = Depends(valid_post_page_query), db: AsyncSession = Depends(get_db_session)):
+    async def produce():
+        page = await sqlalchemy_paginate(db, query)
+        return page.model_dump_json().encode()
+
+    return await response_cache.respond(request, produce)
+
+
+@scrap.get("/post/{post_id}",
+    response_model=PostSchema,
+    status_code=200
+)
+async def get_post(request: Request, post_id: int = Path(ge=1), db: AsyncSession = Depends(get_db_session)):
+    async def produce():
+        post = await valid_post(post_id, db)
+        return PostSchema.model_validate(post, from_attributes=True).model_dump_json().encode()
+
+    return await response_cache.respond(request, produce)
+
+
+@scrap.get("/post/{post_id}/html",
+    response_class=HTMLResponse,
+    status_code=200
+)
+async def get_post_html(html: str = Depends(valid_post_html)):
+    # third-party markup: no script, form or same-origin access from the API origin
+    return HTMLResponse(html, headers=STORED_HTML_HEADERS)
+
+
+@scrap.get("/post/{post_id}/revisions",
+    response_model=list[PostRevisionSchema],
+    status_code=200
+)
+async def get_post_revisions(revisions: list[PostRevisionSchema] = Depends(valid_post_revisions)):
+    return revisions
+
+
+@scrap.get("/search",
+    response_model=Page[PostSearchResultSchema],
+    status_code=200
+)
+async def search_posts(request: Request, query = Depends(valid_search_query), db: AsyncSession = Depends(get_db_session)):
+    async def produce():
+        page = await sqlalchemy_paginate(
+            db,
+            query,
+            transformer=lambda rows: [PostSearchResultSchema.model_validate(dict(row._mapping)) for row in rows],
+        )
+        return page.model_dump_json().encode()
+
+    return await response_cache.respond(request, produce)
+
+
+@scrap.get("/cache/stats",
+    status_code=200
+)
+async def get_cache_stats():
+    return response_cache.stats
+
+
+@scrap.get("/db/stats",
     status_code=200
 )
-async def get_list_post(query = Depends(valid_all_post_query), db: AsyncSession = Depends(get_db_session)):
-    return await sqlalchemy_paginate(db, query)
- 
\ No newline at end of file
+async def get_db_stats():
+    return async_session_manager.pool_stats
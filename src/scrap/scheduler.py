@@ -0,0 +1,270 @@
+import time
+import asyncio
+import logging
+import weakref
+
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from typing import TypeVar
+from urllib.parse import urlsplit
+
+import httpx
+
+from src.scrap.retry import RETRY_STATUSES, CircuitBreaker, RetryPolicy, is_transient
+from src.scrap import metrics
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class TokenBucket:
+    """An asyncio token bucket used to rate limit requests to a single host.
+
+    Tokens are refilled continuously at `rate` per second up to `capacity`.
+    Every call to `acquire` consumes one token, sleeping until one is available.
+
+    Attributes:
+        rate (float): Number of tokens added per second.
+        capacity (float): Maximum number of tokens the bucket can hold (burst size).
+    """
+    def __init__(self, rate: float, capacity: float | None = None):
+        if rate <= 0:
+            raise ValueError("TokenBucket rate must be positive")
+
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self):
+        """Wait until a token is available and consume it."""
+        async with self._lock:
+            while True:
+                self._refill()
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class FetchScheduler:
+    """Bounds the number of in-flight requests and rate limits them per host.
+
+    A single scheduler is shared by every request a `FinancialParser` makes, so
+    the concurrency limit applies to the whole crawl rather than to one batch.
+    Transient failures are retried according to `retry_policy`, and a per-host
+    `breaker` stops hammering a host that keeps failing.
+
+    Attributes:
+        max_concurrency (int): Maximum number of requests in flight at once.
+        rate_per_host (float): Requests per second allowed for each host.
+        burst (float | None): Token bucket capacity, defaults to `rate_per_host`.
+        retry_policy (RetryPolicy): Backoff between attempts of a transient failure.
+        breaker (CircuitBreaker): Per-host circuit breaker.
+    """
+    def __init__(self, max_concurrency: int = 10, rate_per_host: float = 5.0, burst: float | None = None,
+                 retry_policy: RetryPolicy | None = None, breaker: CircuitBreaker | None = None):
+        if max_concurrency < 1:
+            raise ValueError("FetchScheduler max_concurrency must be at least 1")
+
+        self.max_concurrency = max_concurrency
+        self.rate_per_host = rate_per_host
+        self.burst = burst
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def _bucket(self, host: str) -> TokenBucket:
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(self.rate_per_host, self.burst)
+
+        return self._buckets[host]
+
+    async def fetch(self, client: httpx.AsyncClient, url: str, **kwargs) -> httpx.Response:
+        """Perform a GET request once a concurrency slot and a host token are available.
+
+        Timeouts, network errors, 429 and 5xx responses are retried with backoff,
+        sleeping outside the concurrency slot. Every attempt takes a new token.
+
+        Args:
+            client (httpx.AsyncClient): The client whose connection pool is used.
+            url (str): Absolute URL to fetch.
+            **kwargs: Extra arguments passed to `client.get`.
+
+        Returns:
+            httpx.Response: The response of the request.
+
+        Raises:
+            CircuitOpenError: If the circuit of the host is open.
+            httpx.HTTPStatusError: If the last attempt answered 429 or 5xx.
+            httpx.RequestError: If the last attempt failed on the network.
+        """
+        host = urlsplit(url).netloc
+        policy = self.retry_policy
+
+        for attempt in range(policy.max_attempts):
+            self.breaker.check(host)
+            response = None
+
+            try:
+                async with self._semaphore:
+                    await self._bucket(host).acquire()
+                    response = await client.get(url, **kwargs)
+
+                if response.status_code in RETRY_STATUSES:
+                    response.raise_for_status()
+            except Exception as e:
+                if not is_transient(e):
+                    raise
+
+                self._observe(host, response, e)
+                self.breaker.record_failure(host)
+
+                if attempt == policy.max_attempts - 1:
+                    raise
+
+                delay = policy.delay(attempt, response)
+                logger.warning(f"Attempt {attempt + 1} for {url} failed ({e!r}), retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+                continue
+
+            self._observe(host, response, None)
+            self.breaker.record_success(host)
+            return response
+
+    def _observe(self, host: str, response: httpx.Response | None, error: Exception | None):
+        """Called after every attempt with its response and its transient error, if any."""
+
+    async def as_completed(self, func: Callable[[T], Awaitable[R]], items: Iterable[T]) -> AsyncIterator[R]:
+        """Run `func` over `items` and yield each result as soon as it is ready.
+
+        Args:
+            func (Callable): Coroutine function called for every item.
+            items (Iterable): Items to process.
+
+        Yields:
+            The results of `func` in completion order.
+        """
+        tasks = [asyncio.ensure_future(func(item)) for item in items]
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+# Shared schedulers of every running loop: the loop's circuit breaker and its schedulers by name
+_shared: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def get_shared_scheduler(name: str, max_concurrency: int = 10, rate_per_host: float = 5.0) -> FetchScheduler:
+    """The scheduler registered as `name` on the running loop, created on first use.
+
+    Tasks running concurrently on one worker loop, e.g. the chunks of a sharded
+    crawl, get the same scheduler for the same name, so together they stay
+    within its concurrency and rate limits. Every shared scheduler of a loop
+    uses one circuit breaker, so failures of a host count across all of them.
+    Schedulers are per loop because their semaphore and token buckets are bound
+    to the loop that first uses them.
+    """
+    loop = asyncio.get_running_loop()
+
+    if loop not in _shared:
+        _shared[loop] = (CircuitBreaker(), {})
+
+    breaker, schedulers = _shared[loop]
+
+    if name not in schedulers:
+        schedulers[name] = FetchScheduler(max_concurrency=max_concurrency, rate_per_host=rate_per_host, breaker=breaker)
+
+    return schedulers[name]
+
+
+THROTTLE_STATUSES = frozenset({429, 503})
+
+
+class _RateWindow:
+    """Attempts and transient errors of one host since its last rate change."""
+    def __init__(self, backed_off: bool = False):
+        self.attempts = 0
+        self.errors = 0
+        self.backed_off = backed_off
+
+
+class AdaptiveScheduler(FetchScheduler):
+    """A `FetchScheduler` whose per-host rate follows the errors it observes (AIMD).
+
+    Attempts are counted per host in windows of `window` attempts. A window whose
+    transient error rate stays under `error_threshold` adds `increase` requests
+    per second to the rate of the host, any other window multiplies it by
+    `decrease`. A 429 or 503 answer decreases the rate at once, except during the
+    first `max_concurrency` attempts after a decrease, so the answers to requests
+    that were already in flight do not back off again. The rate stays between `min_rate` and `max_rate`.
+
+    Attributes:
+        min_rate (float): Lowest requests per second of a host.
+        max_rate (float): Highest requests per second of a host, defaults to twice
+            `rate_per_host`.
+        increase (float): Requests per second added after a clean window.
+        decrease (float): Factor applied to the rate on throttling or errors.
+        window (int): Attempts per window.
+        error_threshold (float): Highest share of failed attempts of a clean window.
+    """
+    def __init__(self, *args, min_rate: float = 0.2, max_rate: float | None = None, increase: float = 0.5,
+                 decrease: float = 0.5, window: int = 20, error_threshold: float = 0.1, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        if not 0 < decrease < 1:
+            raise ValueError("AdaptiveScheduler decrease must be between 0 and 1")
+
+        self.min_rate = min_rate
+        self.max_rate = max_rate if max_rate is not None else self.rate_per_host * 2
+        self.increase = increase
+        self.decrease = decrease
+        self.window = window
+        self.error_threshold = error_threshold
+        self._windows: dict[str, _RateWindow] = {}
+
+    def rate(self, host: str) -> float:
+        return self._bucket(host).rate
+
+    def _set_rate(self, host: str, rate: float, backed_off: bool = False):
+        bucket = self._bucket(host)
+        rate = min(self.max_rate, max(self.min_rate, rate))
+
+        if rate != bucket.rate:
+            # tokens accrued so far count at the old rate
+            bucket._refill()
+            bucket.rate = rate
+            logger.info(f"Rate of {host} set to {rate:.2f} req/s")
+
+        metrics.FETCH_RATE.labels(host).set(rate)
+        self._windows[host] = _RateWindow(backed_off)
+
+    def _observe(self, host: str, response: httpx.Response | None, error: Exception | None):
+        window = self._windows.setdefault(host, _RateWindow())
+        window.attempts += 1
+
+        if error is not None:
+            window.errors += 1
+
+        if response is not None and response.status_code in THROTTLE_STATUSES:
+            if not window.backed_off or window.attempts > self.max_concurrency:
+                self._set_rate(host, self.rate(host) * self.decrease, backed_off=True)
+        elif window.attempts >= self.window:
+            if window.errors / window.attempts > self.error_threshold:
+                self._set_rate(host, self.rate(host) * self.decrease, backed_off=True)
+            else:
+                self._set_rate(host, self.rate(host) + self.increase)
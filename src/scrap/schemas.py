@@ -1,6 +1,26 @@
 import datetime
-from pydantic import BaseModel
+from typing import Generic, TypeVar
 
+from fastapi import Query
+from fastapi_pagination.bases import CursorRawParams
+from fastapi_pagination.cursor import CursorPage, CursorParams
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+
+
+class PostSummarySchema(BaseModel):
+    id: int | None = None
+    url: str
+    title: str
+    author: str
+    published_at: datetime.datetime
+    scraped_at: datetime.datetime
+
+
+class PostSearchResultSchema(PostSummarySchema):
+    rank: float
 
 
 class PostSchema(BaseModel):
@@ -8,7 +28,52 @@ class PostSchema(BaseModel):
     url: str 
     title: str
     content: str
+    raw_html: str | None = Field(default=None, exclude=True)
+    content_hash: str | None = Field(default=None, exclude=True)
     author: str
     published_at: datetime.datetime
     scraped_at: datetime.datetime
-    
+
+
+class PostRevisionSchema(BaseModel):
+    previous_hash: str | None = None
+    content_hash: str
+    content_size: int
+    revised_at: datetime.datetime
+
+
+class CrawlCheckpointSchema(BaseModel):
+    section: str
+    last_url: str | None = None
+    last_published_at: datetime.datetime | None = None
+    resume_page: str | None = None
+    run_url: str | None = None
+    run_published_at: datetime.datetime | None = None
+    updated_at: datetime.datetime | None = None
+
+
+class DeadLetterSchema(BaseModel):
+    url: str
+    error: str
+    section: str | None = None
+    attempts: int = 1
+
+
+class UpsertResultSchema(BaseModel):
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0
+
+
+class PostCursorParams(CursorParams):
+    include_total: bool = Query(False, description="Count every matching post (slower)")
+
+    def to_raw_params(self) -> CursorRawParams:
+        raw_params = super().to_raw_params()
+        raw_params.include_total = self.include_total
+
+        return raw_params
+
+
+class PostCursorPage(CursorPage[T], Generic[T]):
+    __params_type__ = PostCursorParams
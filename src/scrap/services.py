@@ -1,10 +1,19 @@
+import time
 import logging
-from sqlalchemy import Select, select
+from datetime import datetime
+
+from sqlalchemy import Select, select, delete, literal_column, func
+from sqlalchemy.orm import load_only
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
 
-from src.scrap.schemas import PostSchema
+from src.scrap.schemas import PostSchema, PostRevisionSchema, UpsertResultSchema, CrawlCheckpointSchema, DeadLetterSchema
 
-from src.scrap.models import Post
+from src.scrap.models import Post, PostHtml, PostRevision, CrawlCheckpoint, DeadLetter
+from src.scrap.compression import compress_html, decompress_html
+from src.scrap.extractors import content_hash
+from src.scrap.response_cache import response_cache
+from src.scrap import metrics
 
 
 logger = logging.getLogger(__name__)
@@ -29,8 +38,148 @@ async def get_all_post(db) -> list[PostSchema] | Exception:
         return e
 
 
+def _post_summary_query():
+    # content is never loaded for list responses
+    return select(Post).options(load_only(
+        Post.id, Post.url, Post.title, Post.author, Post.published_at, Post.scraped_at,
+    ))
+
+
 def get_all_post_query():
-    return select(Post)
+    return _post_summary_query()
+
+
+async def get_post(post_id: int, db) -> Post | None:
+    return await db.get(Post, post_id)
+
+
+def get_post_page_query(date_from: datetime | None = None, date_to: datetime | None = None, author: str | None = None):
+    query = _post_summary_query()
+
+    if date_from is not None:
+        query = query.where(Post.published_at >= date_from)
+    if date_to is not None:
+        query = query.where(Post.published_at < date_to)
+    if author is not None:
+        query = query.where(Post.author == author)
+
+    # newest first, id breaks ties so the keyset is unique
+    return query.order_by(Post.published_at.desc(), Post.id.desc())
+
+
+async def get_post_html(post_id: int, db) -> str | None:
+    res = await db.execute(select(PostHtml.html_zstd).where(PostHtml.post_id == post_id))
+    html_zstd = res.scalar_one_or_none()
+
+    return decompress_html(html_zstd) if html_zstd is not None else None
+
+
+async def get_post_revisions(post_id: int, db) -> list[PostRevisionSchema]:
+    query = select(PostRevision).where(PostRevision.post_id == post_id).order_by(PostRevision.revised_at.desc(), PostRevision.id.desc())
+
+    res = await db.execute(query)
+
+    return [PostRevisionSchema.model_validate(revision, from_attributes=True) for revision in res.scalars().all()]
+
+
+async def get_post_urls(db, after_id: int = 0) -> list[tuple[int, str]]:
+    query = select(Post.id, Post.url).where(Post.id > after_id).order_by(Post.id)
+
+    res = await db.execute(query)
+
+    return [(post_id, url) for post_id, url in res.all()]
+
+
+async def get_crawl_checkpoint(section: str, db) -> CrawlCheckpointSchema | None:
+    checkpoint = await db.get(CrawlCheckpoint, section)
+
+    return CrawlCheckpointSchema.model_validate(checkpoint, from_attributes=True) if checkpoint is not None else None
+
+
+async def save_crawl_checkpoint(data: CrawlCheckpointSchema, db) -> CrawlCheckpointSchema | Exception:
+    values = data.model_dump(exclude={"updated_at"})
+    values["updated_at"] = datetime.utcnow()
+
+    query = insert(CrawlCheckpoint).values(values)
+    query = query.on_conflict_do_update(
+        index_elements=[CrawlCheckpoint.section],
+        set_={column: query.excluded[column] for column in values if column != "section"},
+    )
+
+    try:
+        await db.execute(query)
+        await db.commit()
+
+        return data
+    except Exception as e:
+        logger.error("Can not save crawl checkpoint: " + str(e))
+        await db.rollback()
+        return e
+
+
+async def save_dead_letters(data: list[DeadLetterSchema], db) -> int | Exception:
+    """Insert failed URLs into `dead_letters`, adding an attempt to the ones already there."""
+    if not data:
+        return 0
+
+    now = datetime.utcnow()
+    letters = {letter.url: letter for letter in data}
+
+    query = insert(DeadLetter).values([
+        {**letter.model_dump(), "first_failed_at": now, "last_failed_at": now}
+        for letter in letters.values()
+    ])
+    query = query.on_conflict_do_update(
+        index_elements=[DeadLetter.url],
+        set_={
+            "attempts": DeadLetter.attempts + query.excluded.attempts,
+            "error": query.excluded.error,
+            "section": func.coalesce(query.excluded.section, DeadLetter.section),
+            "last_failed_at": query.excluded.last_failed_at,
+        },
+    )
+
+    try:
+        await db.execute(query)
+        await db.commit()
+
+        logger.info(f"Saved {len(letters)} dead letters")
+        return len(letters)
+    except Exception as e:
+        logger.error("Can not save dead letters: " + str(e))
+        await db.rollback()
+        return e
+
+
+async def get_recent_post_urls(db, since: datetime, limit: int = 200) -> list[str]:
+    """URLs of the stored posts published since `since`, the newest first."""
+    query = select(Post.url).where(Post.published_at >= since).order_by(Post.published_at.desc()).limit(limit)
+
+    res = await db.execute(query)
+
+    return list(res.scalars())
+
+
+async def get_dead_letters(db, limit: int = 500, max_attempts: int = 10) -> list[DeadLetterSchema]:
+    """Dead letters still worth retrying, the least recently failed first."""
+    query = (
+        select(DeadLetter)
+        .where(DeadLetter.attempts < max_attempts)
+        .order_by(DeadLetter.last_failed_at)
+        .limit(limit)
+    )
+
+    res = await db.execute(query)
+
+    return [DeadLetterSchema.model_validate(letter, from_attributes=True) for letter in res.scalars()]
+
+
+async def delete_dead_letters(urls: list[str], db):
+    if not urls:
+        return
+
+    await db.execute(delete(DeadLetter).where(DeadLetter.url.in_(urls)))
+    await db.commit()
 
 
 async def create_post(data: PostSchema ,db):
@@ -55,4 +204,182 @@ async def create_post(data: PostSchema ,db):
     except Exception as e:
         logger.error("Can not save data in database: " + str(e))
         return e
-        
\ No newline at end of file
+
+
+SEARCH_CONFIG = "english"
+
+# Postgres only has setweight(tsvector, "char"), a weight bound as a VARCHAR parameter matches no function
+TITLE_WEIGHT = literal_column("'A'")
+
+CONTENT_WEIGHT = literal_column("'B'")
+
+
+def search_vector_expression(title, content):
+    """Weighted tsvector of a post: title terms rank above plain-text body terms."""
+    return func.setweight(func.to_tsvector(SEARCH_CONFIG, title), TITLE_WEIGHT).op("||")(
+        func.setweight(func.to_tsvector(SEARCH_CONFIG, content), CONTENT_WEIGHT)
+    )
+
+
+def get_search_query(q: str):
+    ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+    rank = func.ts_rank_cd(Post.search_vector, ts_query).label("rank")
+
+    return (
+        select(Post.id, Post.url, Post.title, Post.author, Post.published_at, Post.scraped_at, rank)
+        .where(Post.search_vector.op("@@")(ts_query))
+        .order_by(rank.desc(), Post.id.desc())
+    )
+
+
+def _post_values(data: PostSchema) -> dict:
+    return {
+        "url": data.url,
+        "title": data.title,
+        "content": data.content,
+        "author": data.author,
+        "published_at": data.published_at,
+        "scraped_at": data.scraped_at,
+        "content_hash": _content_hash(data),
+        "search_vector": search_vector_expression(data.title, data.content),
+    }
+
+
+def _content_hash(data: PostSchema) -> str:
+    return data.content_hash or content_hash(data.title, data.content)
+
+
+async def _upsert_post_html(rows, posts_by_url: dict[str, PostSchema], db):
+    values = [
+        {"post_id": row.id, "html_zstd": compress_html(post.raw_html), "raw_size": len(post.raw_html.encode())}
+        for row in rows
+        if (post := posts_by_url[row.url]).raw_html is not None
+    ]
+
+    if not values:
+        return
+
+    query = insert(PostHtml).values(values)
+    query = query.on_conflict_do_update(
+        index_elements=[PostHtml.post_id],
+        set_={"html_zstd": query.excluded.html_zstd, "raw_size": query.excluded.raw_size},
+    )
+
+    await db.execute(query)
+
+
+async def _insert_post_revisions(rows, posts_by_url: dict[str, PostSchema], db):
+    values = []
+
+    for row in rows:
+        if row.inserted:
+            continue
+
+        post = posts_by_url[row.url]
+        values.append({
+            "post_id": row.id,
+            "previous_hash": row.previous_hash,
+            "content_hash": _content_hash(post),
+            "content_size": len(post.content.encode()),
+            "revised_at": post.scraped_at,
+        })
+
+    if values:
+        await db.execute(insert(PostRevision).values(values))
+
+
+async def bulk_upsert_posts(data: list[PostSchema], db, on_conflict: str = "nothing", chunk_size: int = 500) -> UpsertResultSchema | Exception:
+    """Insert many posts with `INSERT ... ON CONFLICT (url)`, one transaction per chunk.
+
+    The compressed `raw_html` of every written post goes to `post_html` in the
+    same transaction. Cached API responses are invalidated after every chunk
+    that wrote a row.
+
+    With "update", a stored post is only rewritten when its content hash
+    differs, otherwise it counts as skipped. Every rewrite records a
+    `post_revisions` row with the previous and the new hash.
+
+    Args:
+        data (list[PostSchema]): Posts to persist.
+        db (AsyncSession): The database session.
+        on_conflict (str): "nothing" keeps the stored row, "update" overwrites it
+            when its title or body changed.
+        chunk_size (int): Number of rows sent per statement.
+
+    Returns:
+        UpsertResultSchema: Counts of inserted, updated and skipped posts.
+    """
+    if on_conflict not in ("nothing", "update"):
+        raise ValueError(f"Unknown on_conflict strategy: {on_conflict}")
+
+    result = UpsertResultSchema()
+
+    # ON CONFLICT cannot touch the same row twice in one statement
+    posts_by_url = {post.url: post for post in data}
+    unique_posts = list(posts_by_url.values())
+    result.skipped += len(data) - len(unique_posts)
+
+    try:
+        for start in range(0, len(unique_posts), chunk_size):
+            chunk = unique_posts[start:start + chunk_size]
+
+            query = insert(Post).values([_post_values(post) for post in chunk])
+            returning = [Post.id, Post.url, literal_column("xmax = 0").label("inserted")]
+
+            if on_conflict == "update":
+                # the CTE reads the stored rows as they were before this statement
+                previous = select(Post.url, Post.content_hash).where(Post.url.in_([post.url for post in chunk])).cte("previous_posts")
+
+                query = query.on_conflict_do_update(
+                    index_elements=[Post.url],
+                    set_={
+                        column: query.excluded[column]
+                        for column in ("title", "content", "author", "published_at", "scraped_at", "content_hash", "search_vector")
+                    },
+                    where=Post.content_hash.is_distinct_from(query.excluded.content_hash),
+                ).add_cte(previous)
+
+                returning.append(
+                    select(previous.c.content_hash)
+                    .where(previous.c.url == literal_column("posts.url"))
+                    .scalar_subquery()
+                    .label("previous_hash")
+                )
+            else:
+                query = query.on_conflict_do_nothing(index_elements=[Post.url])
+
+            # xmax is 0 only for rows created by this statement
+            query = query.returning(*returning)
+
+            started = time.perf_counter()
+
+            res = await db.execute(query)
+            rows = res.all()
+            await _upsert_post_html(rows, posts_by_url, db)
+
+            if on_conflict == "update":
+                await _insert_post_revisions(rows, posts_by_url, db)
+
+            await db.commit()
+
+            metrics.DB_WRITE_LATENCY.observe(time.perf_counter() - started)
+
+            if rows:
+                await response_cache.invalidate()
+
+            inserted = sum(1 for row in rows if row.inserted)
+            result.inserted += inserted
+            result.updated += len(rows) - inserted
+            result.skipped += len(chunk) - len(rows)
+
+            metrics.DB_ROWS.labels("inserted").inc(inserted)
+            metrics.DB_ROWS.labels("updated").inc(len(rows) - inserted)
+            metrics.DB_ROWS.labels("skipped").inc(len(chunk) - len(rows))
+
+        logger.info(f"Saved data in database successful: {result.inserted} inserted, "
+                    f"{result.updated} updated, {result.skipped} skipped")
+        return result
+    except Exception as e:
+        logger.error("Can not save data in database: " + str(e))
+        await db.rollback()
+        return e
@@ -0,0 +1,94 @@
+import logging
+
+from collections.abc import Iterable
+from datetime import datetime
+
+import redis.asyncio as redis
+
+logger = logging.getLogger(__name__)
+
+
+CLAIM_PREFIX = "crawl:claimed"
+
+
+def chunked(items: list, size: int) -> list[list]:
+    """Split `items` into consecutive chunks of at most `size` items."""
+    if size < 1:
+        raise ValueError("Chunk size must be at least 1")
+
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+class UrlClaims:
+    """Deduplicates article URLs across Celery workers through Redis.
+
+    A URL is claimed with `SET NX`, so when overlapping sections or overlapping
+    runs list the same article, only the first one schedules its fetch. A chunk
+    whose posts could not be written releases its claims, and claims expire
+    after `ttl` seconds, which lets a URL whose fetch was lost in a crash be
+    picked up again by a later run. Without a Redis URL every URL is claimed.
+
+    Attributes:
+        redis_url (str | None): Redis connection URL.
+        ttl (int): Lifetime of a claim in seconds.
+    """
+    def __init__(self, redis_url: str | None, ttl: int = 3600):
+        self.redis_url = redis_url
+        self.ttl = ttl
+
+    async def claim(self, urls: Iterable[str]) -> list[str]:
+        """Claim `urls` and return the ones no other worker has claimed, in order."""
+        urls = list(dict.fromkeys(urls))
+
+        if self.redis_url is None or not urls:
+            return urls
+
+        client = redis.from_url(self.redis_url)
+
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                for url in urls:
+                    pipe.set(f"{CLAIM_PREFIX}:{url}", 1, nx=True, ex=self.ttl)
+
+                claimed = await pipe.execute()
+        finally:
+            await client.aclose()
+
+        return [url for url, ok in zip(urls, claimed) if ok]
+
+    async def release(self, urls: Iterable[str]):
+        """Drop the claims of `urls`, so the next run can fetch them again."""
+        keys = [f"{CLAIM_PREFIX}:{url}" for url in urls]
+
+        if self.redis_url is None or not keys:
+            return
+
+        client = redis.from_url(self.redis_url)
+
+        try:
+            await client.delete(*keys)
+        finally:
+            await client.aclose()
+
+
+def summarize_chunks(results: list[dict], started_at: datetime, finished_at: datetime) -> dict:
+    """Add up the counts returned by the chunk tasks of one sharded crawl.
+
+    Returns:
+        dict: Summed counts, the number of chunks, the duration in seconds and the
+            throughput in fetched articles per second.
+    """
+    totals = {"fetched": 0, "inserted": 0, "updated": 0, "skipped": 0, "failed": 0}
+
+    for result in results:
+        for key in totals:
+            totals[key] += result.get(key, 0)
+
+    duration = (finished_at - started_at).total_seconds()
+
+    return {
+        **totals,
+        "chunks": len(results),
+        "duration": duration,
+        "throughput": totals["fetched"] / duration if duration > 0 else 0.0,
+    }
@@ -0,0 +1,69 @@
+import logging
+
+from src.scrap.schemas import PostSchema, UpsertResultSchema
+from src.scrap.services import bulk_upsert_posts
+
+logger = logging.getLogger(__name__)
+
+
+class PostSink:
+    """Buffers parsed posts and flushes them to Postgres in small batches.
+
+    Used together with `FinancialParser.iter_crawl`, at most `batch_size` posts
+    are held in memory, and everything flushed before a crash stays in the
+    database. Leaving the `async with` block flushes the remaining posts, even
+    when it is left because of an error. `on_flush` is awaited after every
+    successful flush until a flush fails, e.g. to save a crawl checkpoint that
+    must not move past posts that were lost. By default a post that
+    is already stored is only rewritten, with a revision, when its content hash
+    changed.
+
+    Attributes:
+        db (AsyncSession): The database session.
+        batch_size (int): Number of posts written per flush.
+        on_conflict (str): Conflict strategy passed to `bulk_upsert_posts`.
+        result (UpsertResultSchema): Counts accumulated over every flush.
+        failed (int): Number of posts lost to failed flushes.
+        on_flush (Callable | None): Coroutine function called after a successful flush,
+            as long as no flush has failed.
+    """
+    def __init__(self, db, batch_size: int = 50, on_conflict: str = "update", on_flush=None):
+        self.db = db
+        self.batch_size = batch_size
+        self.on_conflict = on_conflict
+        self.on_flush = on_flush
+        self.result = UpsertResultSchema()
+        self.failed = 0
+        self._buffer: list[PostSchema] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.flush()
+
+    async def add(self, post: PostSchema):
+        self._buffer.append(post)
+
+        if len(self._buffer) >= self.batch_size:
+            await self.flush()
+
+    async def flush(self):
+        if not self._buffer:
+            return
+
+        batch, self._buffer = self._buffer, []
+
+        res = await bulk_upsert_posts(batch, self.db, on_conflict=self.on_conflict, chunk_size=self.batch_size)
+
+        if isinstance(res, Exception):
+            self.failed += len(batch)
+            return
+
+        self.result.inserted += res.inserted
+        self.result.updated += res.updated
+        self.result.skipped += res.skipped
+
+        # progress saved after a lost batch would move past its posts
+        if self.on_flush is not None and not self.failed:
+            await self.on_flush()
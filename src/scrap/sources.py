@@ -0,0 +1,46 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class Section(BaseModel):
+    """A listing section of a news source and how to crawl it.
+
+    Attributes:
+        name (str): Unique name of the section, also its checkpoint key.
+        base_url (str): Scheme and host of the source, e.g. 'https://www.ft.com'.
+        listing_path (str): Path of the first listing page, e.g. '/world'.
+        extractor (str): Name of the extractor backend that reads the source pages,
+            see `src.scrap.extractors.EXTRACTORS`.
+        max_concurrency (int): Maximum number of requests in flight for the section.
+        rate_per_host (float): Requests per second the section may send to the source.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    name: str
+    base_url: str
+    listing_path: str
+    extractor: str = "strained"
+    max_concurrency: int = 10
+    rate_per_host: float = 5.0
+
+    @property
+    def queue(self) -> str:
+        """Celery queue the crawls of the section are routed to."""
+        return f"crawl.{self.name}"
+
+
+# Every section gets its own scheduler, so the FT sections split the usual 5 requests per second
+SECTIONS: dict[str, Section] = {
+    section.name: section
+    for section in (
+        Section(name="ft-world", base_url="https://www.ft.com", listing_path="/world", rate_per_host=2.0),
+        Section(name="ft-markets", base_url="https://www.ft.com", listing_path="/markets", rate_per_host=1.5),
+        Section(name="ft-companies", base_url="https://www.ft.com", listing_path="/companies", rate_per_host=1.5),
+    )
+}
+
+
+def get_section(name: str) -> Section:
+    try:
+        return SECTIONS[name]
+    except KeyError:
+        raise ValueError(f"Unknown section: {name}") from None
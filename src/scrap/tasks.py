@@ -1,77 +1,418 @@
 from datetime import timedelta, datetime
-import asyncio
+from collections import defaultdict
+import os
 import logging
 import logging.config
 
+import redis
+from celery import chord, group
+from celery.signals import worker_ready
+
 from src.scrap.celery import celery_app
+from src.scrap.worker_loop import AsyncTask
 from src.log_conf import CELERY_LOGGING_CONFIG
 
 from src.scrap.financial_parser import FinancialParser
+from src.scrap.http_cache import HttpCache
+from src.scrap.url_index import KnownUrlIndex
+from src.scrap.parse_pool import get_parse_pool
 from src.database import get_db_session
-from src.scrap.services import create_post
+from src.scrap.sink import PostSink
+from src.scrap import services, metrics
+from src.scrap.checkpoint import CrawlCheckpoint
+from src.scrap.sources import SECTIONS, Section, get_section
+from src.scrap.sharding import UrlClaims, chunked, summarize_chunks
 
 logging.config.dictConfig(CELERY_LOGGING_CONFIG)
 
 logger = logging.getLogger('celery_app')
 
+http_cache = HttpCache(os.getenv("HTTP_CACHE_PATH", "http_cache.sqlite3"))
+
+known_urls = KnownUrlIndex()
+
+# Parsing is offloaded to worker processes only when a pool size is configured
+parse_pool = get_parse_pool() if os.getenv("PARSE_POOL_WORKERS") else None
+
+url_claims = UrlClaims(os.getenv("REDIS_URL"), ttl=int(os.getenv("CRAWL_CLAIM_TTL", 3600)))
+
+# Article chunks of every section go to one queue that any worker can consume
+ARTICLES_QUEUE = "crawl.articles"
+
+CHUNK_SIZE = int(os.getenv("CRAWL_CHUNK_SIZE", 25))
+
+DEAD_LETTER_MAX_ATTEMPTS = int(os.getenv("DEAD_LETTER_MAX_ATTEMPTS", 10))
+
+REVISIT_DAYS = float(os.getenv("REVISIT_DAYS", 2))
+
+REVISIT_LIMIT = int(os.getenv("REVISIT_LIMIT", 200))
+
+
+async def save_dead_letters(finan: FinancialParser, section: Section, session):
+    letters = [letter.model_copy(update={"section": section.name}) for letter in finan.dead_letters]
+
+    res = await services.save_dead_letters(letters, session)
+
+    if isinstance(res, Exception):
+        logger.error(f"Lost {len(letters)} dead letters of {section.name}: {res}")
+
 
-@celery_app.on_after_finalize.connect
+STARTUP_LOCK_KEY = "crawl:startup-backfill"
+
+STARTUP_LOCK_TTL = int(os.getenv("STARTUP_BACKFILL_LOCK_TTL", 3600))
+
+
+def acquire_startup_lock(redis_url: str | None) -> bool:
+    """Take the cluster-wide startup backfill lock, True if this process got it.
+
+    The lock is never released, it expires after `STARTUP_LOCK_TTL` seconds, so
+    workers starting or restarting within that window do not backfill again.
+    Without Redis there is nothing to coordinate with and the lock is always taken.
+    """
+    if redis_url is None:
+        return True
+
+    client = redis.Redis.from_url(redis_url, socket_connect_timeout=2, socket_timeout=2)
+
+    try:
+        return bool(client.set(STARTUP_LOCK_KEY, os.getpid(), nx=True, ex=STARTUP_LOCK_TTL))
+    finally:
+        client.close()
+
+
+@worker_ready.connect
 def init_parser(sender, **kwarg):
+    """Enqueue the startup backfill instead of running it, so the worker is ready at once."""
     try:
-        asyncio.run(scrap_task_once())
+        if not acquire_startup_lock(os.getenv("REDIS_URL")):
+            logger.info("Startup backfill already taken by another worker.")
+            return
+
+        scrap_task_once.apply_async()
+        logger.info("Startup backfill enqueued.")
 
-    except RuntimeError as e:
-        logger.error(f"Failed to trigger scrap_task_once in on_after_finalize: {e}")
     except Exception as e:
-        logger.error(f"Unexpected error when triggering scrap_task_once: {e}")
+        logger.error(f"Failed to enqueue the startup backfill: {e}")
 
 
-@celery_app.task(is_async=True)
-async def scrap_hourly_task():
-    logger.info("Starting fetch data by one hour.")
+async def scrap_period(period: timedelta, section: Section = SECTIONS["ft-world"]):
+    """Crawl the listing of `section` down to its checkpoint and stream every parsed post into the database.
+
+    `period` only bounds the first crawl of a section, later runs stop at the
+    newest article stored by the previous one.
+    """
+    async for session in get_db_session():
+        await known_urls.refresh(session)
+
+        checkpoint = await CrawlCheckpoint.load(section.name, session)
 
-    finan = FinancialParser()
+        finan = FinancialParser.from_section(section, shared_scheduler=True, cache=http_cache, known_urls=known_urls, parse_pool=parse_pool, checkpoint=checkpoint)
 
-    logger.log("Scraping...")
+        logger.info(f"Scraping {section.name}...")
 
-    await finan.parsing(timedelta(hours=1))
+        async with PostSink(session, on_flush=lambda: checkpoint.save(session)) as sink:
+            async for post in finan.iter_crawl(period):
+                await sink.add(post)
 
-    data = await finan.pars_post_data()
+        await save_dead_letters(finan, section, session)
 
-    logger.info(f"DONE! Fetched: {len(data)} post")
+        # a failed flush keeps the last saved progress, so the next run resumes before the lost posts
+        if sink.failed:
+            logger.warning(f"Checkpoint of {section.name} not finished: {sink.failed} posts failed to save")
+        else:
+            await checkpoint.save(session)
 
-    logger.info("Starting save data in database...")
+    logger.info(f"DONE {section.name}! Fetched: {len(finan.post_list_link)} post links, "
+                f"skipped {finan.skipped_known} already stored, "
+                f"saved {sink.result.inserted}, failed {sink.failed}")
+
+    if parse_pool is not None:
+        logger.info(f"Parse pool: {parse_pool.stats}")
+
+    return {"status": "done", "section": section.name, **sink.result.model_dump(), "failed": sink.failed, "scraped_at": datetime.utcnow()}
+
+
+async def list_section(period: timedelta, section: Section, chunk_size: int = CHUNK_SIZE):
+    """Walk the listing of `section` and shard its new articles into a chord of fetch tasks.
+
+    Only the listing is crawled here. The article links are claimed in Redis, so
+    an article listed by several sections or overlapping runs is fetched once.
+    The claimed links are sent in chunks of `chunk_size` to `fetch_articles_task`
+    on the shared articles queue, and `aggregate_crawl_task` runs once every
+    chunk is done. The checkpoint is only finished by the aggregation, and not
+    at all when links were left to another claim holder: that holder may be a
+    failed earlier run, and the stop mark must not move past its articles.
+    """
+    started_at = datetime.utcnow()
 
     async for session in get_db_session():
-        for post in data:
-            await create_post(post, session)
+        await known_urls.refresh(session)
 
+        checkpoint = await CrawlCheckpoint.load(section.name, session)
 
-    return {"status": "done", "scraped_at": datetime.utcnow()}
-    
+        finan = FinancialParser.from_section(section, shared_scheduler=True, cache=http_cache, known_urls=known_urls, parse_pool=parse_pool, checkpoint=checkpoint)
 
+        await finan.parsing(period)
 
-@celery_app.task(is_async=True)
-async def scrap_task_once():
-    logger.info("Starting scraping month financial time posts.")
+        claimed = await url_claims.claim(f"{finan.base_url}{link}" for link in finan.post_list_link)
+        links = [url.removeprefix(finan.base_url) for url in claimed]
+
+        claimed_elsewhere = len(finan.post_list_link) - len(links)
+
+        logger.info(f"Listed {section.name}: {len(finan.post_list_link)} new links, "
+                    f"{claimed_elsewhere} claimed by other workers")
+
+        if not links:
+            if claimed_elsewhere:
+                logger.warning(f"Checkpoint of {section.name} not finished: "
+                               f"{claimed_elsewhere} links are claimed by other workers")
+            else:
+                checkpoint.finish()
+                await checkpoint.save(session)
+
+            return {"status": "done", "section": section.name, "chunks": 0, "claimed_elsewhere": claimed_elsewhere}
+
+    chunks = chunked(links, chunk_size)
+
+    chord(
+        fetch_articles_task.s(section.name, chunk).set(queue=ARTICLES_QUEUE)
+        for chunk in chunks
+    )(aggregate_crawl_task.s(
+        section.name,
+        started_at.isoformat(),
+        checkpoint.run_url,
+        checkpoint.run_published_at.isoformat() if checkpoint.run_published_at else None,
+        claimed_elsewhere,
+    ))
+
+    return {"status": "dispatched", "section": section.name, "links": len(links), "chunks": len(chunks)}
+
+
+async def fetch_articles(section: Section, links: list[str]):
+    """Fetch, parse and persist one chunk of article links of `section`.
+
+    When the chunk fails or some of its posts are not written, the claims of its
+    links are released, so the next run of any section can fetch them again.
+    """
+    finan = FinancialParser.from_section(section, shared_scheduler=True, cache=http_cache, parse_pool=parse_pool)
+    finan.post_list_link = list(links)
+    urls = [f"{finan.base_url}{link}" for link in links]
+
+    try:
+        async for session in get_db_session():
+            async with PostSink(session) as sink:
+                async for post in finan.iter_post_data():
+                    await sink.add(post)
+
+            await save_dead_letters(finan, section, session)
+    except Exception:
+        await url_claims.release(urls)
+        raise
+
+    if sink.failed:
+        await url_claims.release(urls)
+
+    return {"fetched": len(links), **sink.result.model_dump(), "failed": sink.failed, "dead_letters": len(finan.dead_letters)}
+
+
+async def aggregate_crawl(results: list[dict], section: Section, started_at: datetime,
+                          run_url: str | None, run_published_at: datetime | None, claimed_elsewhere: int = 0):
+    """Report the totals of a sharded crawl and move the section checkpoint forward.
+
+    The checkpoint is only finished when every listed link was written by this
+    run, i.e. no post failed to save and no link was left to another claim holder.
+    """
+    summary = summarize_chunks(results, started_at, datetime.utcnow())
+
+    logger.info(f"DONE {section.name}! Fetched {summary['fetched']} articles in {summary['chunks']} chunks, "
+                f"saved {summary['inserted']}, updated {summary['updated']}, failed {summary['failed']}, "
+                f"{summary['duration']:.1f}s, {summary['throughput']:.2f} articles/s")
+
+    if summary["failed"]:
+        logger.warning(f"Checkpoint of {section.name} not finished: {summary['failed']} posts failed to save")
+    elif claimed_elsewhere:
+        logger.warning(f"Checkpoint of {section.name} not finished: "
+                       f"{claimed_elsewhere} links are claimed by other workers")
+    else:
+        async for session in get_db_session():
+            checkpoint = await CrawlCheckpoint.load(section.name, session)
+            checkpoint.run_url = run_url
+            checkpoint.run_published_at = run_published_at
+            checkpoint.finish()
+            await checkpoint.save(session)
+
+    return {"status": "done", "section": section.name, **summary}
 
-    finan = FinancialParser()
-    
-    logger.info("Scraping...")
-    
-    await finan.parsing(timedelta(days=1))
-    
-    logger.info("fetch data from post")
-    
-    data = await finan.pars_post_data()
-    
-    logger.info(f"DONE! Fetched: {len(data)} post")
 
-    logger.info("Starting save data in database...")
+async def retry_dead_letters(limit: int = 500):
+    """Fetch the dead-lettered articles again, section by section.
 
+    Recovered articles are saved and their dead letters deleted. Articles failing
+    again get one more attempt counted, and are no longer retried once they
+    reach `DEAD_LETTER_MAX_ATTEMPTS`.
+    """
+    recovered = failed = 0
 
     async for session in get_db_session():
-        for post in data:
-            await create_post(post, session)
+        letters = await services.get_dead_letters(session, limit=limit, max_attempts=DEAD_LETTER_MAX_ATTEMPTS)
+
+        urls_by_section = defaultdict(list)
+
+        for letter in letters:
+            urls_by_section[letter.section].append(letter.url)
+
+        for section_name, urls in urls_by_section.items():
+            section = SECTIONS.get(section_name)
+
+            if section is None:
+                logger.warning(f"Skipped {len(urls)} dead letters of unknown section {section_name}")
+                continue
+
+            finan = FinancialParser.from_section(section, shared_scheduler=True, parse_pool=parse_pool)
+            finan.post_list_link = [url.removeprefix(section.base_url) for url in urls]
+
+            async with PostSink(session) as sink:
+                async for post in finan.iter_post_data():
+                    await sink.add(post)
+
+            if sink.failed:
+                logger.warning(f"Kept {len(urls)} dead letters of {section_name}: {sink.failed} posts failed to save")
+                continue
+
+            still_failing = {letter.url for letter in finan.dead_letters}
+
+            await services.delete_dead_letters([url for url in urls if url not in still_failing], session)
+            await save_dead_letters(finan, section, session)
+
+            recovered += len(urls) - len(still_failing)
+            failed += len(still_failing)
+
+    logger.info(f"Dead letters retried: {recovered} recovered, {failed} still failing")
+
+    return {"status": "done", "recovered": recovered, "failed": failed}
+
+
+def fan_out_sections(period: timedelta):
+    """Enqueue one `list_section_task` per registered section, each on the section queue."""
+    listings = group(
+        list_section_task.s(section.name, period.total_seconds()).set(queue=section.queue)
+        for section in SECTIONS.values()
+    )
+
+    return listings.apply_async()
+
+
+async def revisit_recent(days: float = REVISIT_DAYS, limit: int = REVISIT_LIMIT):
+    """Fetch the stored articles of the last `days` again and record the ones that changed.
+
+    Regular crawls never fetch a stored article twice, so this is how updates
+    made after publication are picked up. Known URLs and cached validators are
+    bypassed and every article is downloaded in full. `PostSink` only rewrites
+    the posts whose content hash changed, each with a revision row.
+    """
+    urls = []
+    revised = unchanged = failed = 0
+    sections_by_base_url: dict[str, Section] = {}
+
+    for section in SECTIONS.values():
+        sections_by_base_url.setdefault(section.base_url, section)
+
+    async for session in get_db_session():
+        urls = await services.get_recent_post_urls(session, since=datetime.utcnow() - timedelta(days=days), limit=limit)
+
+        urls_by_section = defaultdict(list)
+
+        for url in urls:
+            section = next((section for base_url, section in sections_by_base_url.items() if url.startswith(base_url)), None)
+
+            if section is None:
+                logger.warning(f"Skipped revisit of {url}: no section for its source")
+                continue
+
+            urls_by_section[section].append(url)
+
+        for section, section_urls in urls_by_section.items():
+            finan = FinancialParser.from_section(section, shared_scheduler=True, parse_pool=parse_pool)
+            finan.post_list_link = [url.removeprefix(section.base_url) for url in section_urls]
+
+            async with PostSink(session) as sink:
+                async for post in finan.iter_post_data():
+                    await sink.add(post)
+
+            revised += sink.result.updated
+            unchanged += sink.result.skipped
+            failed += sink.failed + len(finan.dead_letters)
+
+    logger.info(f"Revisited {len(urls)} recent articles: {revised} revised, {unchanged} unchanged, {failed} failed")
+
+    return {"status": "done", "revisited": len(urls), "revised": revised, "unchanged": unchanged, "failed": failed}
+
+
+@celery_app.task(base=AsyncTask)
+async def crawl_section_task(section_name: str, period_seconds: float):
+    logger.info(f"Starting crawl of {section_name}.")
+
+    with metrics.TASK_DURATION.labels("crawl_section").time():
+        return await scrap_period(timedelta(seconds=period_seconds), get_section(section_name))
+
+
+@celery_app.task(base=AsyncTask)
+async def list_section_task(section_name: str, period_seconds: float):
+    logger.info(f"Starting listing of {section_name}.")
+
+    with metrics.TASK_DURATION.labels("list_section").time():
+        return await list_section(timedelta(seconds=period_seconds), get_section(section_name))
+
+
+@celery_app.task(base=AsyncTask)
+async def fetch_articles_task(section_name: str, links: list[str]):
+    with metrics.TASK_DURATION.labels("fetch_articles").time():
+        return await fetch_articles(get_section(section_name), links)
+
+
+@celery_app.task(base=AsyncTask)
+async def aggregate_crawl_task(results: list[dict], section_name: str, started_at: str,
+                               run_url: str | None, run_published_at: str | None, claimed_elsewhere: int = 0):
+    with metrics.TASK_DURATION.labels("aggregate_crawl").time():
+        return await aggregate_crawl(
+            results,
+            get_section(section_name),
+            datetime.fromisoformat(started_at),
+            run_url,
+            datetime.fromisoformat(run_published_at) if run_published_at else None,
+            claimed_elsewhere,
+        )
+
+
+@celery_app.task
+def scrap_hourly_task():
+    logger.info("Starting fetch data by one hour.")
+
+    result = fan_out_sections(timedelta(hours=1))
+
+    return {"status": "dispatched", "group_id": result.id, "sections": list(SECTIONS)}
+
+
+@celery_app.task
+def scrap_task_once():
+    logger.info("Starting scraping month financial time posts.")
+
+    result = fan_out_sections(timedelta(days=1))
+
+    return {"status": "dispatched", "group_id": result.id, "sections": list(SECTIONS)}
+
+
+@celery_app.task(base=AsyncTask)
+async def retry_dead_letters_task(limit: int = 500):
+    logger.info("Retrying dead letters.")
+
+    with metrics.TASK_DURATION.labels("retry_dead_letters").time():
+        return await retry_dead_letters(limit)
+
+
+@celery_app.task(base=AsyncTask)
+async def revisit_recent_task():
+    logger.info("Revisiting recent articles.")
 
-    return {"status": "done", "scraped_at": datetime.utcnow()}
+    with metrics.TASK_DURATION.labels("revisit_recent").time():
+        return await revisit_recent()
@@ -0,0 +1,55 @@
+import logging
+
+from src.scrap import services
+
+logger = logging.getLogger(__name__)
+
+
+class KnownUrlIndex:
+    """An in-memory set of article URLs that are already stored in `posts`.
+
+    The index is loaded from the database once and then refreshed incrementally:
+    every refresh reads the rows whose id is greater than the last one seen minus
+    `overlap`. Concurrent workers commit their ids out of order, so a row with a
+    lower id can become visible after a higher one was loaded, and the overlap
+    re-reads that window. `FinancialParser` consults the index before queuing a
+    link, so stored articles are never downloaded again.
+
+    Attributes:
+        last_id (int): Highest `posts.id` loaded so far.
+        overlap (int): Ids below `last_id` read again by every refresh.
+    """
+    def __init__(self, overlap: int = 1000):
+        self._urls: set[str] = set()
+        self.last_id = 0
+        self.overlap = overlap
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._urls
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+    def add(self, url: str):
+        self._urls.add(url)
+
+    async def refresh(self, db) -> int:
+        """Load the URLs stored since the last refresh.
+
+        Args:
+            db (AsyncSession): The database session.
+
+        Returns:
+            int: Number of new URLs added to the index.
+        """
+        rows = await services.get_post_urls(db, after_id=max(0, self.last_id - self.overlap))
+        before = len(self._urls)
+
+        for post_id, url in rows:
+            self._urls.add(url)
+            self.last_id = max(self.last_id, post_id)
+
+        added = len(self._urls) - before
+
+        logger.info(f"Known URL index refreshed: {added} new, {len(self._urls)} total")
+        return added
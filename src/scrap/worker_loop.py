@@ -0,0 +1,100 @@
+import os
+import asyncio
+import inspect
+import logging
+import threading
+
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+from celery import Task
+
+from src.database import async_session_manager
+from src.scrap.http_client import close_http_client
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class WorkerLoop:
+    """A long-lived event loop running in a daemon thread of a worker process.
+
+    Coroutines are submitted from any thread with `run`, which blocks the caller
+    until the coroutine finishes. With the Celery threads pool, every worker
+    thread submits its task to the same loop, so several crawls run concurrently
+    and share the HTTP client, the pooled database connections and the
+    module-level caches, which all stay bound to this one loop.
+    """
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_forever, name="worker-loop", daemon=True)
+        self._thread.start()
+
+    def _run_forever(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread.is_alive() and not self.loop.is_closed()
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """Run `coro` on the loop and return its result, raising its exception."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+    async def _close_resources(self):
+        await close_http_client()
+        await async_session_manager.close()
+
+    def stop(self, timeout: float = 10.0):
+        """Close the HTTP client and the database pool on the loop, then stop it."""
+        if not self.is_running:
+            return
+
+        try:
+            self.run(self._close_resources(), timeout)
+        except Exception as e:
+            logger.error(f"Failed to close worker loop resources: {e}")
+
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
+        self.loop.close()
+
+
+_worker_loop: WorkerLoop | None = None
+_worker_loop_pid: int | None = None
+_lock = threading.Lock()
+
+
+def get_worker_loop() -> WorkerLoop:
+    """Return the loop of this process, starting it on first use and again after a fork."""
+    global _worker_loop, _worker_loop_pid
+
+    with _lock:
+        if _worker_loop is None or _worker_loop_pid != os.getpid() or not _worker_loop.is_running:
+            _worker_loop = WorkerLoop()
+            _worker_loop_pid = os.getpid()
+
+        return _worker_loop
+
+
+def shutdown_worker_loop():
+    global _worker_loop
+
+    with _lock:
+        if _worker_loop is not None and _worker_loop_pid == os.getpid():
+            _worker_loop.stop()
+
+        _worker_loop = None
+
+
+class AsyncTask(Task):
+    """A Celery task whose body may be a coroutine function, run on the worker loop."""
+    def __call__(self, *args, **kwargs):
+        result = super().__call__(*args, **kwargs)
+
+        if inspect.isawaitable(result):
+            return get_worker_loop().run(result)
+
+        return result
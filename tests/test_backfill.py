@@ -0,0 +1,80 @@
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from src.scrap import backfill
+from src.scrap.backfill import backfill_section, first_page_where, locate_pages, split_pages
+from src.scrap.sources import get_section
+
+
+@pytest.mark.asyncio
+async def test_first_page_where_brackets_and_bisects():
+    probed = []
+
+    async def predicate(number):
+        probed.append(number)
+        return number >= 13
+
+    assert await first_page_where(predicate, max_page=100) == 13
+    assert len(probed) <= 9
+    assert await first_page_where(AsyncMock(return_value=False), max_page=100) == 101
+    assert await first_page_where(AsyncMock(return_value=True), max_page=100) == 1
+
+
+def test_split_pages():
+    assert split_pages(range(3, 13), 4) == [range(3, 6), range(6, 9), range(9, 12), range(12, 13)]
+    assert split_pages(range(1, 3), 4) == [range(1, 2), range(2, 3)]
+    assert split_pages(range(5, 5), 4) == []
+
+    with pytest.raises(ValueError):
+        split_pages(range(1, 3), 0)
+
+
+@pytest.mark.asyncio
+async def test_locate_pages_finds_the_pages_of_the_date_range():
+    # 40 pages of 5 teasers, one teaser an hour, newest first
+    newest = datetime(2025, 7, 1)
+    listing = {
+        page: [newest - timedelta(hours=(page - 1) * 5 + i) for i in range(5)]
+        for page in range(1, 41)
+    }
+    parser = MagicMock(section="ft-world")
+    parser.probe_listing_page = AsyncMock(side_effect=lambda number: listing.get(number, []))
+
+    pages = await locate_pages(parser, newest - timedelta(hours=60), newest - timedelta(hours=22))
+
+    # hour 22 is the 3rd teaser of page 5, hour 60 the 1st teaser of page 13
+    assert pages == range(5, 14)
+    assert await locate_pages(parser, datetime(2020, 1, 1), datetime(2020, 2, 1)) == range(41, 41)
+
+
+@pytest.mark.asyncio
+async def test_backfill_section_runs_partitions_and_counts_failures(mocker):
+    async def fake_session():
+        yield MagicMock()
+
+    mocker.patch.object(backfill, "get_db_session", fake_session)
+    mocker.patch.object(backfill.KnownUrlIndex, "refresh", AsyncMock(return_value=0))
+    crawled = []
+
+    async def crawl_partition(parser, section, pages, start, end, progress):
+        crawled.append(pages)
+
+        if pages.start == 7:
+            raise RuntimeError("database down")
+
+        for number in pages:
+            progress.page_done(number)
+
+        progress.partition_done(MagicMock(result=MagicMock(inserted=3, updated=0, skipped=1), failed=0), 2)
+
+    mocker.patch.object(backfill, "crawl_partition", crawl_partition)
+
+    result = await backfill_section(get_section("ft-markets"), datetime(2025, 6, 1), datetime(2025, 7, 1),
+                                    partitions=3, pages=range(1, 10))
+
+    assert crawled == [range(1, 4), range(4, 7), range(7, 10)]
+    assert result["section"] == "ft-markets"
+    assert result["pages"] == 6
+    assert result["failed_partitions"] == 1
+    assert result["inserted"] == 6
+    assert result["dead_letters"] == 4
@@ -0,0 +1,50 @@
+import pytest
+from unittest.mock import MagicMock
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import NullPool
+from sqlalchemy.util import greenlet_spawn
+from src.database import InstrumentedQueuePool, engine_options
+
+
+def test_engine_options_from_environment(monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "20")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "0")
+    monkeypatch.setenv("DB_STATEMENT_CACHE_SIZE", "0")
+    monkeypatch.delenv("DB_ECHO", raising=False)
+
+    options = engine_options()
+
+    assert options["echo"] is False
+    assert options["pool_pre_ping"] is True
+    assert options["poolclass"] is InstrumentedQueuePool
+    assert options["pool_size"] == 20
+    assert options["max_overflow"] == 0
+    assert options["connect_args"] == {"prepared_statement_cache_size": 0}
+
+
+def test_null_pool_drops_pool_sizing(monkeypatch):
+    monkeypatch.setenv("DB_NULL_POOL", "true")
+
+    options = engine_options()
+
+    assert options["poolclass"] is NullPool
+    assert "pool_size" not in options
+
+
+@pytest.mark.asyncio
+async def test_pool_reports_saturation_and_checkout_timeouts():
+    pool = InstrumentedQueuePool(MagicMock, pool_size=1, max_overflow=0, timeout=0.01)
+
+    conn = await greenlet_spawn(pool.connect)
+
+    with pytest.raises(PoolTimeoutError):
+        await greenlet_spawn(pool.connect)
+
+    stats = pool.stats
+    assert stats["saturation"] == 1.0
+    assert stats["checkouts"] == 2
+    assert stats["timeouts"] == 1
+    assert stats["max_checkout_latency"] >= 0.01
+
+    await greenlet_spawn(conn.close)
+    assert pool.stats["saturation"] == 0.0
@@ -0,0 +1,69 @@
+import pytest
+from pathlib import Path
+from src.scrap.extractors import SoupExtractor, StrainedSoupExtractor, content_hash, get_extractor
+from src.scrap.parse_pool import ParsePool
+
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+PAYWALL_HTML = '<html><body><a id="charge-button">Subscribe</a><article id="article-body"></article></body></html>'
+
+
+def test_strained_backend_matches_reference_on_article():
+    article_html = (FIXTURES / "ft_article.html").read_text()
+
+    expected = SoupExtractor().extract_article(article_html)
+
+    assert StrainedSoupExtractor().extract_article(article_html) == expected
+    assert expected["author"] == "Jane ExampleJohn Sample"
+    assert expected["raw_html"].startswith('<article class="n-content-body js-article__content-body" id="article-body">')
+    assert "<" not in expected["content"]
+    assert expected["content"].count("\n\n") == 25
+
+
+def test_strained_backend_matches_reference_on_listing():
+    html = (FIXTURES / "ft_listing.html").read_text()
+
+    teasers, next_page = StrainedSoupExtractor().extract_listing(html)
+
+    assert (teasers, next_page) == SoupExtractor().extract_listing(html)
+    assert len(teasers) == 25
+    assert teasers[0] == ("/content/1000", "2025-07-20T23:00:00.000Z")
+    assert next_page == "?page=3"
+
+
+@pytest.mark.parametrize("backend", ["soup", "strained"])
+def test_paywalled_article_is_skipped(backend):
+    assert get_extractor(backend).extract_article(PAYWALL_HTML) is None
+
+
+def test_content_hash_ignores_whitespace_and_unicode_form():
+    digest = content_hash("Caf\u00e9 prices", "First  paragraph.\n\nSecond paragraph.")
+
+    assert len(digest) == 64
+    assert content_hash(" Cafe\u0301 prices", "First paragraph. Second\tparagraph. ") == digest
+    assert content_hash("Caf\u00e9 prices", "First paragraph. Second paragraph, updated.") != digest
+    assert content_hash("Caf\u00e9 prices, updated", "First paragraph. Second paragraph.") != digest
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        get_extractor("regex")
+
+
+@pytest.mark.asyncio
+async def test_parse_pool_returns_same_records_and_tracks_metrics():
+    article_html = (FIXTURES / "ft_article.html").read_text()
+    listing_html = (FIXTURES / "ft_listing.html").read_text()
+    pool = ParsePool(max_workers=1)
+
+    try:
+        assert await pool.extract_article(article_html) == StrainedSoupExtractor().extract_article(article_html)
+        assert await pool.extract_listing(listing_html) == StrainedSoupExtractor().extract_listing(listing_html)
+    finally:
+        pool.shutdown()
+
+    stats = pool.stats
+    assert stats["parsed"] == 2
+    assert stats["queue_depth"] == 0
+    assert stats["max_latency"] >= stats["avg_latency"] > 0
@@ -0,0 +1,84 @@
+import pytest
+import httpx
+from datetime import timedelta
+from src.scrap.financial_parser import FinancialParser
+from src.scrap.http_cache import HttpCache
+
+
+LISTING_HTML = """
+<html>
+    <body>
+        <li class="o-teaser-collection__item o-grid-row">
+            <a data-trackable="heading-link" href="/content/123"></a>
+            <time class="o3-type-label o-date" datetime="2025-07-20T12:00:00"></time>
+        </li>
+    </body>
+</html>
+"""
+
+ARTICLE_HTML = """
+<html>
+    <body>
+        <h1 class="o-topper__headline">Cached Article</h1>
+        <a data-trackable="author">Author One</a>
+        <article id="article-body"><p>Test content</p></article>
+        <time class="article-info__timestamp o3-editorial-typography-byline-timestamp o-date" datetime="2025-07-20T12:00:00"></time>
+    </body>
+</html>
+"""
+
+
+def stub_server(requests_log):
+    """A local FT stand-in that honours If-None-Match like a real server."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_log.append(request)
+        etag = f'"{request.url.path}-v1"'
+
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+
+        body = ARTICLE_HTML if request.url.path.startswith("/content/") else LISTING_HTML
+        return httpx.Response(200, text=body, headers={"ETag": etag})
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = HttpCache(str(tmp_path / "http_cache.sqlite3"))
+    yield cache
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_second_run_sends_conditional_requests_and_skips_parsing(cache):
+    requests_log = []
+
+    async with httpx.AsyncClient(transport=stub_server(requests_log)) as client:
+        first = await FinancialParser(client=client, cache=cache).crawl(timedelta(days=365 * 100))
+        second = await FinancialParser(client=client, cache=cache).crawl(timedelta(days=365 * 100))
+
+    assert [post.title for post in first] == ["Cached Article"]
+    assert second == []
+    assert requests_log[-1].headers["If-None-Match"] == '"/world-v1"'
+    assert cache.hits == 1
+    # only listing pages are requested conditionally
+    assert cache.misses == 1
+    assert cache.conditional_headers("https://www.ft.com/content/123") == {}
+
+
+def test_cache_evicts_least_recently_used(cache):
+    cache.max_entries = 2
+    response = httpx.Response(200, headers={"ETag": '"v1"', "Last-Modified": "Sun, 20 Jul 2025 12:00:00 GMT"})
+
+    cache.store("https://www.ft.com/a", response)
+    cache.store("https://www.ft.com/b", response)
+    cache.record("https://www.ft.com/a", httpx.Response(304))
+    cache.store("https://www.ft.com/c", response)
+
+    assert len(cache) == 2
+    assert cache.conditional_headers("https://www.ft.com/b") == {}
+    assert cache.conditional_headers("https://www.ft.com/a") == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Sun, 20 Jul 2025 12:00:00 GMT",
+    }
@@ -0,0 +1,91 @@
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock
+from fastapi.testclient import TestClient
+from src import app
+from src.scrap.models import Post
+from src.scrap.response_cache import LRUCache, ResponseCache, VERSION_KEY, response_cache
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def incr(self, key):
+        self.data[key] = int(self.data.get(key, 0)) + 1
+
+
+class BrokenRedis:
+    async def get(self, key):
+        raise ConnectionError("redis is down")
+
+
+def make_produce(value=b"{}"):
+    return AsyncMock(return_value=value)
+
+
+def test_lru_evicts_least_recently_used_and_expires(mocker):
+    lru = LRUCache(max_entries=2, ttl=10)
+    lru.set("a", b"1")
+    lru.set("b", b"2")
+    lru.get("a")
+    lru.set("c", b"3")
+
+    assert lru.get("b") is None
+    assert lru.get("a") == b"1"
+
+    mocker.patch("src.scrap.response_cache.time.monotonic", return_value=float("inf"))
+    assert lru.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_redis_version_bump_invalidates_cached_responses(mocker):
+    cache = ResponseCache(redis_url="redis://redis:6379/2")
+    fake = FakeRedis()
+    mocker.patch.object(cache, "_redis", return_value=fake)
+    produce = make_produce()
+
+    assert await cache.get_or_set("/financial/post-list?page=1", produce) == (b"{}", False)
+    assert await cache.get_or_set("/financial/post-list?page=1", produce) == (b"{}", True)
+
+    await cache.invalidate()
+
+    assert fake.data[VERSION_KEY] == 1
+    assert await cache.get_or_set("/financial/post-list?page=1", produce) == (b"{}", False)
+    assert produce.await_count == 2
+    assert cache.stats["hit_rate"] == pytest.approx(1 / 3)
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_memory_when_redis_fails(mocker):
+    cache = ResponseCache(redis_url="redis://redis:6379/2")
+    mocker.patch("src.scrap.response_cache.redis.from_url", return_value=BrokenRedis())
+    produce = make_produce()
+
+    assert await cache.get_or_set("key", produce) == (b"{}", False)
+    assert await cache.get_or_set("key", produce) == (b"{}", True)
+    assert cache.errors == 1
+    assert cache.stats["backend"] == "memory"
+
+
+def test_post_detail_is_served_from_cache(mocker):
+    response_cache.local.clear()
+    post = Post(id=7, url="https://www.ft.com/content/7", title="Title", content="Body", author="Jane",
+                published_at=datetime(2025, 7, 1), scraped_at=datetime(2025, 7, 2))
+    get_post = mocker.patch("src.scrap.dependencies.services.get_post", AsyncMock(return_value=post))
+    client = TestClient(app)
+
+    first = client.get("/financial/post/7")
+    second = client.get("/financial/post/7")
+
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.json() == first.json()
+    assert second.json()["title"] == "Title"
+    get_post.assert_awaited_once()
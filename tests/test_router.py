@@ -0,0 +1,98 @@
+import pytest
+from unittest.mock import AsyncMock
+from datetime import datetime
+from types import SimpleNamespace
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+from src import app
+from src.scrap.schemas import PostCursorParams, PostRevisionSchema
+from src.scrap.services import get_all_post_query, get_post_page_query, get_search_query
+
+
+def compile_query(query):
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+def test_post_page_query_orders_by_keyset_and_filters():
+    sql = compile_query(get_post_page_query(datetime(2025, 7, 1), datetime(2025, 8, 1), "Jane Example"))
+
+    assert "posts.published_at >= " in sql
+    assert "posts.published_at < " in sql
+    assert "posts.author = " in sql
+    assert sql.endswith("ORDER BY posts.published_at DESC, posts.id DESC")
+
+
+def test_cursor_params_total_is_optional():
+    assert PostCursorParams(cursor=None, size=10, include_total=False).to_raw_params().include_total is False
+    assert PostCursorParams(cursor=None, size=10, include_total=True).to_raw_params().include_total is True
+
+
+def test_post_page_rejects_inverted_date_range():
+    client = TestClient(app)
+
+    response = client.get("/financial/posts", params={"date_from": "2025-08-01T00:00:00", "date_to": "2025-07-01T00:00:00"})
+
+    assert response.status_code == 422
+
+
+def test_list_queries_do_not_load_content():
+    assert "posts.content" not in compile_query(get_all_post_query())
+    assert "posts.content" not in compile_query(get_post_page_query())
+
+
+def test_post_detail_not_found(mocker):
+    mocker.patch("src.scrap.dependencies.services.get_post", AsyncMock(return_value=None))
+    client = TestClient(app)
+
+    response = client.get("/financial/post/42")
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Post 42 not found"}
+
+
+def test_post_revisions_lists_content_changes(mocker):
+    mocker.patch("src.scrap.dependencies.services.get_post", AsyncMock(return_value=SimpleNamespace(id=42)))
+    get_post_revisions = mocker.patch("src.scrap.dependencies.services.get_post_revisions", AsyncMock(return_value=[
+        PostRevisionSchema(previous_hash="a" * 64, content_hash="b" * 64, content_size=1200, revised_at=datetime(2025, 7, 21)),
+    ]))
+    client = TestClient(app)
+
+    response = client.get("/financial/post/42/revisions")
+
+    assert response.status_code == 200
+    assert response.json() == [{
+        "previous_hash": "a" * 64, "content_hash": "b" * 64, "content_size": 1200, "revised_at": "2025-07-21T00:00:00",
+    }]
+    assert get_post_revisions.await_args.args[0] == 42
+
+
+def test_post_html_is_sandboxed(mocker):
+    mocker.patch("src.scrap.dependencies.services.get_post_html", AsyncMock(return_value="<article><script>alert(1)</script></article>"))
+    client = TestClient(app)
+
+    response = client.get("/financial/post/42/html")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert response.headers["content-security-policy"] == "sandbox"
+    assert response.headers["x-content-type-options"] == "nosniff"
+
+
+def test_search_query_ranks_matches():
+    sql = compile_query(get_search_query("central bank"))
+
+    assert "posts.search_vector @@ websearch_to_tsquery(" in sql
+    assert "ts_rank_cd(posts.search_vector, websearch_to_tsquery(" in sql
+    assert sql.endswith("ORDER BY rank DESC, posts.id DESC")
+    assert "posts.content" not in sql
+
+
+def test_metrics_are_exported():
+    client = TestClient(app)
+
+    response = client.get("/metrics/")
+
+    assert response.status_code == 200
+    # labelled histograms only get samples once observed, their TYPE line is always there
+    assert "# TYPE scraper_fetch_seconds histogram" in response.text
+    assert "scraper_db_write_seconds_bucket" in response.text
@@ -0,0 +1,246 @@
+import pytest
+import httpx
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+from src.scrap.financial_parser import FinancialParser
+from src.scrap.scheduler import AdaptiveScheduler, FetchScheduler, TokenBucket, get_shared_scheduler
+from src.scrap.sources import Section
+from src.scrap.retry import CircuitBreaker, CircuitOpenError, RetryPolicy
+
+
+@pytest.mark.asyncio
+async def test_scheduler_limits_concurrency():
+    scheduler = FetchScheduler(max_concurrency=2, rate_per_host=1000)
+    in_flight = 0
+    peak = 0
+
+    async def fake_get(url, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return MagicMock()
+
+    client = MagicMock()
+    client.get = fake_get
+
+    await asyncio.gather(*[scheduler.fetch(client, f"https://example.com/{i}") for i in range(10)])
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_rate_limits():
+    bucket = TokenBucket(rate=50, capacity=1)
+
+    start = time.monotonic()
+    for _ in range(6):
+        await bucket.acquire()
+
+    assert time.monotonic() - start >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_scheduler_yields_results_as_completed():
+    scheduler = FetchScheduler()
+
+    async def work(delay):
+        await asyncio.sleep(delay)
+        return delay
+
+    results = [res async for res in scheduler.as_completed(work, [0.03, 0.0, 0.01])]
+
+    assert results == [0.0, 0.01, 0.03]
+
+
+@pytest.mark.asyncio
+async def test_pars_post_data_skips_failed_articles(mocker):
+    parser = FinancialParser(max_concurrency=2)
+    parser.post_list_link = ["/content/1", "/content/2"]
+    mocker.patch.object(
+        parser,
+        "_FinancialParser__parsing_single_data",
+        AsyncMock(side_effect=[None, "post"]),
+    )
+
+    result = await parser.pars_post_data()
+
+    assert result == ["post"]
+    assert parser.article_data == ["post"]
+
+
+def make_response(status_code, headers=None):
+    return httpx.Response(status_code, headers=headers, request=httpx.Request("GET", "https://example.com/a"))
+
+
+@pytest.mark.asyncio
+async def test_scheduler_retries_transient_errors_honouring_retry_after(mocker):
+    sleep = mocker.patch("src.scrap.scheduler.asyncio.sleep", AsyncMock())
+    client = MagicMock()
+    client.get = AsyncMock(side_effect=[
+        make_response(503, {"Retry-After": "7"}),
+        httpx.ConnectTimeout("timeout"),
+        make_response(200),
+    ])
+    scheduler = FetchScheduler(rate_per_host=1000, retry_policy=RetryPolicy(max_attempts=3, base_delay=1.0))
+
+    response = await scheduler.fetch(client, "https://example.com/a")
+
+    assert response.status_code == 200
+    assert sleep.await_args_list[0].args[0] == 7.0
+    assert 0 <= sleep.await_args_list[1].args[0] <= 2.0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_gives_up_after_max_attempts_and_skips_client_errors(mocker):
+    mocker.patch("src.scrap.scheduler.asyncio.sleep", AsyncMock())
+    client = MagicMock()
+    client.get = AsyncMock(return_value=make_response(429))
+    scheduler = FetchScheduler(rate_per_host=1000, retry_policy=RetryPolicy(max_attempts=2))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await scheduler.fetch(client, "https://example.com/a")
+    assert client.get.await_count == 2
+
+    client.get = AsyncMock(return_value=make_response(404))
+    assert (await scheduler.fetch(client, "https://example.com/a")).status_code == 404
+    assert client.get.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_opens_and_half_opens(mocker):
+    monotonic = mocker.patch("src.scrap.retry.time.monotonic", return_value=100.0)
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+
+    breaker.record_failure("example.com")
+    breaker.check("example.com")
+    breaker.record_failure("example.com")
+
+    with pytest.raises(CircuitOpenError):
+        breaker.check("example.com")
+
+    monotonic.return_value = 131.0
+    breaker.check("example.com")
+    breaker.record_failure("example.com")
+    assert breaker.is_open("example.com")
+
+    monotonic.return_value = 162.0
+    breaker.check("example.com")
+    breaker.record_success("example.com")
+    assert not breaker.is_open("example.com")
+
+
+@pytest.mark.asyncio
+async def test_half_open_circuit_lets_one_trial_request_through(mocker):
+    monotonic = mocker.patch("src.scrap.retry.time.monotonic", return_value=100.0)
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure("example.com")
+    monotonic.return_value = 131.0
+
+    trial = asyncio.Event()
+
+    async def fake_get(url, **kwargs):
+        await trial.wait()
+        return make_response(200)
+
+    client = MagicMock()
+    client.get = fake_get
+    scheduler = FetchScheduler(rate_per_host=1000, breaker=breaker)
+
+    tasks = [asyncio.create_task(scheduler.fetch(client, f"https://example.com/{i}")) for i in range(5)]
+    await asyncio.sleep(0)
+    assert breaker.is_half_open("example.com")
+    trial.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert sum(1 for res in results if isinstance(res, httpx.Response)) == 1
+    assert sum(1 for res in results if isinstance(res, CircuitOpenError)) == 4
+    assert not breaker.is_open("example.com") and not breaker.is_half_open("example.com")
+    breaker.check("example.com")
+
+
+def test_half_open_trial_that_never_reports_back_is_replaced(mocker):
+    monotonic = mocker.patch("src.scrap.retry.time.monotonic", return_value=100.0)
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure("example.com")
+
+    monotonic.return_value = 131.0
+    breaker.check("example.com")
+
+    with pytest.raises(CircuitOpenError):
+        breaker.check("example.com")
+
+    monotonic.return_value = 162.0
+    breaker.check("example.com")
+    assert breaker.is_half_open("example.com")
+
+
+def test_adaptive_scheduler_increases_additively_and_decreases_multiplicatively():
+    scheduler = AdaptiveScheduler(max_concurrency=2, rate_per_host=2.0, max_rate=3.0, window=4)
+    host = "example.com"
+
+    for _ in range(4):
+        scheduler._observe(host, make_response(200), None)
+    assert scheduler.rate(host) == 2.5
+
+    for _ in range(8):
+        scheduler._observe(host, make_response(200), None)
+    assert scheduler.rate(host) == 3.0
+
+    # the first 429 backs off at once, the ones already in flight do not
+    scheduler._observe(host, make_response(429), None)
+    assert scheduler.rate(host) == 1.5
+    scheduler._observe(host, make_response(429), None)
+    scheduler._observe(host, make_response(429), None)
+    assert scheduler.rate(host) == 1.5
+    scheduler._observe(host, make_response(429), None)
+    assert scheduler.rate(host) == 0.75
+
+
+def test_adaptive_scheduler_backs_off_on_error_rate():
+    scheduler = AdaptiveScheduler(rate_per_host=2.0, min_rate=0.8, window=10, error_threshold=0.1)
+    host = "example.com"
+
+    for i in range(10):
+        scheduler._observe(host, None, httpx.ConnectTimeout("timeout") if i < 2 else None)
+    assert scheduler.rate(host) == 1.0
+
+    for i in range(10):
+        scheduler._observe(host, None, httpx.ConnectTimeout("timeout") if i < 2 else None)
+    assert scheduler.rate(host) == 0.8
+
+
+@pytest.mark.asyncio
+async def test_adaptive_scheduler_observes_every_attempt(mocker):
+    mocker.patch("src.scrap.scheduler.asyncio.sleep", AsyncMock())
+    client = MagicMock()
+    client.get = AsyncMock(side_effect=[make_response(429), make_response(200)])
+    scheduler = AdaptiveScheduler(rate_per_host=1000, max_rate=1000)
+
+    response = await scheduler.fetch(client, "https://example.com/a")
+
+    assert response.status_code == 200
+    assert scheduler.rate("example.com") == 500
+
+
+@pytest.mark.asyncio
+async def test_concurrent_chunks_share_the_section_rate():
+    section = Section(name="test-shared", base_url="https://example.com", listing_path="/world", rate_per_host=40.0)
+    client = MagicMock()
+    client.get = AsyncMock(return_value=make_response(404))
+    chunks = [FinancialParser.from_section(section, shared_scheduler=True, client=client) for _ in range(2)]
+
+    for i, parser in enumerate(chunks):
+        parser.post_list_link = [f"/content/{i}-{n}" for n in range(30)]
+
+    assert chunks[0].scheduler is chunks[1].scheduler
+    assert chunks[0].scheduler.breaker is get_shared_scheduler("other").breaker
+
+    start = time.monotonic()
+    await asyncio.gather(*(parser.pars_post_data() for parser in chunks))
+
+    # 40 tokens of burst, then 40 per second: the 60 requests take at least 0.5s together
+    assert client.get.await_count == 60
+    assert time.monotonic() - start >= 0.45
@@ -0,0 +1,247 @@
+import re
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+from src.scrap.schemas import PostSchema, UpsertResultSchema, DeadLetterSchema
+from src.scrap.services import bulk_upsert_posts, save_dead_letters
+from src.scrap.compression import decompress_html
+from src.scrap.extractors import content_hash
+from src.scrap.sink import PostSink
+from src.scrap.checkpoint import CrawlCheckpoint
+
+
+def make_post(url):
+    return PostSchema(
+        url=url,
+        title="Title",
+        content="Body",
+        raw_html="<article><p>Body</p></article>",
+        author="Author",
+        published_at=datetime(2025, 7, 20, 12),
+        scraped_at=datetime(2025, 7, 20, 13),
+    )
+
+
+def make_db(*returned_rows, previous_hash=None):
+    """A session whose posts inserts return `returned_rows`, one list of inserted flags per chunk."""
+    db = AsyncMock()
+    chunks = iter(returned_rows)
+
+    def execute(query):
+        res = MagicMock()
+        if query.table.name == "posts":
+            params = query.compile(dialect=postgresql.dialect()).params
+            res.all.return_value = [
+                SimpleNamespace(id=i, url=params[f"url_m{i}"], inserted=flag, previous_hash=previous_hash)
+                for i, flag in enumerate(next(chunks))
+            ]
+        return res
+
+    db.execute.side_effect = execute
+    return db
+
+
+def posts_statements(db):
+    return [call.args[0] for call in db.execute.await_args_list if call.args[0].table.name == "posts"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_counts_inserted_and_skipped_in_chunks():
+    posts = [make_post(f"https://www.ft.com/content/{i}") for i in range(3)]
+    db = make_db([True, True], [])
+
+    result = await bulk_upsert_posts(posts, db, chunk_size=2)
+
+    assert result.model_dump() == {"inserted": 2, "updated": 0, "skipped": 1}
+    assert len(posts_statements(db)) == 2
+    assert db.commit.await_count == 2
+
+    sql = str(posts_statements(db)[0].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (url) DO NOTHING" in sql
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_update_counts_updated_rows_and_dedupes_batch():
+    posts = [make_post("https://www.ft.com/content/1"), make_post("https://www.ft.com/content/1"), make_post("https://www.ft.com/content/2")]
+    db = make_db([True, False])
+
+    result = await bulk_upsert_posts(posts, db, on_conflict="update")
+
+    assert result.model_dump() == {"inserted": 1, "updated": 1, "skipped": 1}
+
+    sql = str(posts_statements(db)[0].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (url) DO UPDATE" in sql
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_returns_error_and_rolls_back():
+    db = AsyncMock()
+    db.execute.side_effect = RuntimeError("connection lost")
+
+    result = await bulk_upsert_posts([make_post("https://www.ft.com/content/1")], db)
+
+    assert isinstance(result, RuntimeError)
+    db.rollback.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_post_sink_flushes_in_batches_and_on_exit(mocker):
+    bulk_upsert = mocker.patch(
+        "src.scrap.sink.bulk_upsert_posts",
+        AsyncMock(side_effect=lambda batch, db, **kwargs: UpsertResultSchema(inserted=len(batch))),
+    )
+
+    async with PostSink(AsyncMock(), batch_size=2) as sink:
+        for i in range(5):
+            await sink.add(make_post(f"https://www.ft.com/content/{i}"))
+
+        assert bulk_upsert.await_count == 2
+
+    assert [len(call.args[0]) for call in bulk_upsert.await_args_list] == [2, 2, 1]
+    assert sink.result.inserted == 5
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_fills_search_vector():
+    db = make_db([True])
+
+    await bulk_upsert_posts([make_post("https://www.ft.com/content/1")], db, on_conflict="update")
+
+    sql = str(posts_statements(db)[0].compile(dialect=postgresql.dialect()))
+    assert "setweight(to_tsvector(" in sql
+    assert "search_vector = excluded.search_vector" in sql
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_search_weights_are_sql_literals_for_asyncpg():
+    db = make_db([True])
+
+    await bulk_upsert_posts([make_post("https://www.ft.com/content/1")], db, on_conflict="update")
+
+    # asyncpg binds strings as $N::VARCHAR, and Postgres has no setweight(tsvector, varchar)
+    sql = str(posts_statements(db)[0].compile(dialect=asyncpg_dialect()))
+    weights = re.findall(r"setweight\(to_tsvector\(\$\d+::REGCONFIG, \$\d+::VARCHAR\), ([^)]+)\)", sql)
+    assert weights == ["'A'", "'B'"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_stores_compressed_html_in_same_transaction():
+    db = make_db([True])
+
+    await bulk_upsert_posts([make_post("https://www.ft.com/content/1")], db)
+
+    html_insert = db.execute.await_args_list[-1].args[0]
+    params = html_insert.compile(dialect=postgresql.dialect()).params
+    assert html_insert.table.name == "post_html"
+    assert decompress_html(params["html_zstd_m0"]) == "<article><p>Body</p></article>"
+    assert params["raw_size_m0"] == len("<article><p>Body</p></article>")
+    db.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_invalidates_cached_responses_only_after_writes(mocker):
+    invalidate = mocker.patch("src.scrap.services.response_cache.invalidate", AsyncMock())
+
+    await bulk_upsert_posts([make_post("https://www.ft.com/content/1")], make_db([]))
+    invalidate.assert_not_awaited()
+
+    await bulk_upsert_posts([make_post("https://www.ft.com/content/1")], make_db([True]))
+    invalidate.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_post_sink_calls_on_flush_after_successful_flushes(mocker):
+    results = iter([UpsertResultSchema(inserted=1), RuntimeError("connection lost")])
+    mocker.patch("src.scrap.sink.bulk_upsert_posts", AsyncMock(side_effect=lambda *args, **kwargs: next(results)))
+    on_flush = AsyncMock()
+
+    async with PostSink(AsyncMock(), batch_size=1, on_flush=on_flush) as sink:
+        await sink.add(make_post("https://www.ft.com/content/1"))
+        await sink.add(make_post("https://www.ft.com/content/2"))
+
+    on_flush.assert_awaited_once()
+    assert sink.failed == 1
+
+
+@pytest.mark.asyncio
+async def test_post_sink_stops_calling_on_flush_after_a_failed_flush(mocker):
+    results = iter([RuntimeError("connection lost"), UpsertResultSchema(inserted=1), UpsertResultSchema(inserted=1)])
+    mocker.patch("src.scrap.sink.bulk_upsert_posts", AsyncMock(side_effect=lambda *args, **kwargs: next(results)))
+    on_flush = AsyncMock()
+
+    async with PostSink(AsyncMock(), batch_size=1, on_flush=on_flush) as sink:
+        for i in range(3):
+            await sink.add(make_post(f"https://www.ft.com/content/{i}"))
+
+    on_flush.assert_not_awaited()
+    assert sink.failed == 1
+    assert sink.result.inserted == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_checkpoint_before_the_lost_page(mocker):
+    results = iter([UpsertResultSchema(inserted=1), RuntimeError("connection lost"), UpsertResultSchema(inserted=1)])
+    mocker.patch("src.scrap.sink.bulk_upsert_posts", AsyncMock(side_effect=lambda *args, **kwargs: next(results)))
+    save = mocker.patch("src.scrap.checkpoint.services.save_crawl_checkpoint", AsyncMock())
+    checkpoint = CrawlCheckpoint("ft-world")
+    pages = [checkpoint.open_page() for _ in range(3)]
+
+    async with PostSink(AsyncMock(), batch_size=1, on_flush=lambda: checkpoint.save(None)) as sink:
+        for i, (page, next_page) in enumerate(zip(pages, ["?page=2", "?page=3", "?page=4"])):
+            checkpoint.close_page(page, next_page)
+            await sink.add(make_post(f"https://www.ft.com/content/{i}"))
+
+    assert save.await_count == 1
+    assert save.await_args.args[0].resume_page == "?page=2"
+
+
+@pytest.mark.asyncio
+async def test_save_dead_letters_counts_attempts_on_conflict():
+    db = AsyncMock()
+    letters = [
+        DeadLetterSchema(url="https://www.ft.com/content/1", error="ReadTimeout()", section="ft-world"),
+        DeadLetterSchema(url="https://www.ft.com/content/1", error="ReadTimeout()", section="ft-world"),
+    ]
+
+    assert await save_dead_letters(letters, db) == 1
+
+    sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (url) DO UPDATE" in sql
+    assert "attempts = (dead_letters.attempts + excluded.attempts)" in sql
+    db.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_update_skips_unchanged_hash_and_records_revisions():
+    posts = [make_post("https://www.ft.com/content/1"), make_post("https://www.ft.com/content/2")]
+    db = make_db([True, False], previous_hash="a" * 64)
+
+    result = await bulk_upsert_posts(posts, db, on_conflict="update")
+
+    assert result.model_dump() == {"inserted": 1, "updated": 1, "skipped": 0}
+
+    query = posts_statements(db)[0]
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("WITH previous_posts AS")
+    assert "WHERE posts.content_hash IS DISTINCT FROM excluded.content_hash" in sql
+    assert query.compile(dialect=postgresql.dialect()).params["content_hash_m0"] == content_hash("Title", "Body")
+
+    revisions = [call.args[0] for call in db.execute.await_args_list if call.args[0].table.name == "post_revisions"]
+    assert len(revisions) == 1
+    params = revisions[0].compile(dialect=postgresql.dialect()).params
+    assert params["post_id_m0"] == 1
+    assert params["previous_hash_m0"] == "a" * 64
+    assert params["content_hash_m0"] == content_hash("Title", "Body")
+    assert params["content_size_m0"] == 4
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_nothing_records_no_revisions():
+    db = make_db([False])
+
+    await bulk_upsert_posts([make_post("https://www.ft.com/content/1")], db)
+
+    assert all(call.args[0].table.name != "post_revisions" for call in db.execute.await_args_list)
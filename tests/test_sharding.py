@@ -0,0 +1,134 @@
+import os
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+os.environ.setdefault("HTTP_CACHE_PATH", ":memory:")
+
+from src.scrap import tasks
+from src.scrap.sharding import UrlClaims, chunked, summarize_chunks
+from src.scrap.sources import get_section
+
+
+def test_chunked_splits_in_order():
+    assert chunked(list(range(5)), 2) == [[0, 1], [2, 3], [4]]
+    assert chunked([], 2) == []
+
+    with pytest.raises(ValueError):
+        chunked([1], 0)
+
+
+@pytest.mark.asyncio
+async def test_url_claims_only_return_unclaimed_urls(mocker):
+    claimed = {"https://www.ft.com/content/2"}
+    pipe = MagicMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    pipe.execute = AsyncMock(side_effect=lambda: [
+        None if call.args[0].endswith(tuple(claimed)) else True for call in pipe.set.call_args_list
+    ])
+    client = MagicMock(aclose=AsyncMock())
+    client.pipeline.return_value = pipe
+    mocker.patch("src.scrap.sharding.redis.from_url", return_value=client)
+
+    urls = ["https://www.ft.com/content/1", "https://www.ft.com/content/2", "https://www.ft.com/content/1"]
+    result = await UrlClaims("redis://redis:6379/0", ttl=60).claim(urls)
+
+    assert result == ["https://www.ft.com/content/1"]
+    assert pipe.set.call_args_list[0].kwargs == {"nx": True, "ex": 60}
+    client.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_url_claims_without_redis_claim_everything():
+    assert await UrlClaims(None).claim(["a", "b", "a"]) == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_url_claims_release_deletes_the_claims(mocker):
+    client = MagicMock(delete=AsyncMock(), aclose=AsyncMock())
+    mocker.patch("src.scrap.sharding.redis.from_url", return_value=client)
+
+    await UrlClaims("redis://redis:6379/0").release(["https://www.ft.com/content/1", "https://www.ft.com/content/2"])
+
+    client.delete.assert_awaited_once_with(
+        "crawl:claimed:https://www.ft.com/content/1", "crawl:claimed:https://www.ft.com/content/2",
+    )
+    client.aclose.assert_awaited_once()
+
+
+def test_summarize_chunks_reports_totals_and_throughput():
+    started_at = datetime(2025, 7, 1)
+    results = [
+        {"fetched": 25, "inserted": 20, "updated": 0, "skipped": 1, "failed": 0},
+        {"fetched": 15, "inserted": 10, "updated": 2, "skipped": 0, "failed": 1},
+    ]
+
+    summary = summarize_chunks(results, started_at, started_at + timedelta(seconds=8))
+
+    assert summary["fetched"] == 40
+    assert summary["inserted"] == 30
+    assert summary["failed"] == 1
+    assert summary["chunks"] == 2
+    assert summary["throughput"] == 5.0
+
+
+@pytest.fixture
+def fake_session(mocker):
+    async def fake_session():
+        yield MagicMock()
+
+    mocker.patch.object(tasks, "get_db_session", fake_session)
+    mocker.patch.object(tasks.known_urls, "refresh", AsyncMock(return_value=0))
+
+
+@pytest.mark.asyncio
+async def test_list_section_keeps_checkpoint_when_links_are_claimed_elsewhere(mocker, fake_session):
+    checkpoint = MagicMock(save=AsyncMock())
+    mocker.patch.object(tasks.CrawlCheckpoint, "load", AsyncMock(return_value=checkpoint))
+
+    async def parsing(self, period):
+        self.post_list_link = ["/content/1", "/content/2"]
+
+    mocker.patch.object(tasks.FinancialParser, "parsing", parsing)
+    mocker.patch.object(tasks.url_claims, "claim", AsyncMock(return_value=[]))
+
+    result = await tasks.list_section(timedelta(hours=1), get_section("ft-world"))
+
+    assert result["claimed_elsewhere"] == 2
+    checkpoint.finish.assert_not_called()
+    checkpoint.save.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_aggregate_crawl_keeps_checkpoint_when_links_are_claimed_elsewhere(mocker, fake_session):
+    load = mocker.patch.object(tasks.CrawlCheckpoint, "load", AsyncMock())
+    results = [{"fetched": 2, "inserted": 2, "updated": 0, "skipped": 0, "failed": 0}]
+
+    await tasks.aggregate_crawl(results, get_section("ft-world"), datetime.utcnow(), None, None, claimed_elsewhere=1)
+
+    load.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_fetch_articles_releases_claims_of_a_failed_chunk(mocker, fake_session):
+    release = mocker.patch.object(tasks.url_claims, "release", AsyncMock())
+
+    async def iter_post_data(self):
+        yield MagicMock()
+
+    mocker.patch.object(tasks.FinancialParser, "iter_post_data", iter_post_data)
+    mocker.patch("src.scrap.sink.bulk_upsert_posts", AsyncMock(return_value=RuntimeError("database down")))
+
+    result = await tasks.fetch_articles(get_section("ft-world"), ["/content/1"])
+
+    assert result["failed"] == 1
+    release.assert_awaited_once_with(["https://www.ft.com/content/1"])
+
+    release.reset_mock()
+    mocker.patch.object(tasks.FinancialParser, "iter_post_data", side_effect=RuntimeError("worker lost"))
+
+    with pytest.raises(RuntimeError):
+        await tasks.fetch_articles(get_section("ft-world"), ["/content/1"])
+
+    release.assert_awaited_once_with(["https://www.ft.com/content/1"])
@@ -0,0 +1,75 @@
+import os
+import time
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+os.environ.setdefault("HTTP_CACHE_PATH", ":memory:")
+
+from src.scrap import tasks
+from src.scrap.celery import celery_app
+from src.scrap.schemas import UpsertResultSchema
+
+
+@pytest.fixture
+def no_crawl(mocker):
+    """Fail the test if anything starts crawling during startup."""
+    mocker.patch.object(tasks, "scrap_period", side_effect=AssertionError("crawl ran at startup"))
+    mocker.patch.object(tasks, "list_section", side_effect=AssertionError("crawl ran at startup"))
+
+
+def test_worker_startup_only_enqueues_the_backfill(mocker, no_crawl):
+    mocker.patch.object(tasks, "acquire_startup_lock", return_value=True)
+    apply_async = mocker.patch.object(tasks.scrap_task_once, "apply_async")
+
+    start = time.perf_counter()
+    celery_app.finalize()
+    tasks.init_parser(sender=None)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.5
+    apply_async.assert_called_once_with()
+
+
+def test_startup_backfill_runs_once_across_workers(mocker, no_crawl):
+    mocker.patch.object(tasks, "acquire_startup_lock", side_effect=[True, False])
+    apply_async = mocker.patch.object(tasks.scrap_task_once, "apply_async")
+
+    tasks.init_parser(sender=None)
+    tasks.init_parser(sender=None)
+
+    apply_async.assert_called_once_with()
+
+
+def test_startup_lock_uses_set_nx_with_ttl(mocker):
+    client = mocker.patch("src.scrap.tasks.redis.Redis.from_url").return_value
+    client.set.return_value = None
+
+    assert tasks.acquire_startup_lock("redis://redis:6379/0") is False
+    assert client.set.call_args.kwargs == {"nx": True, "ex": tasks.STARTUP_LOCK_TTL}
+    assert tasks.acquire_startup_lock(None) is True
+
+
+@pytest.mark.asyncio
+async def test_revisit_recent_refetches_stored_articles_without_validators(mocker):
+    async def fake_session():
+        yield MagicMock()
+
+    urls = ["https://www.ft.com/content/a", "https://www.ft.com/content/b", "https://example.com/c"]
+    seen = {}
+
+    async def iter_post_data(self):
+        seen.update(cache=self.cache, known_urls=self.known_urls, links=list(self.post_list_link))
+
+        for link in self.post_list_link:
+            yield MagicMock(url=f"{self.base_url}{link}")
+
+    mocker.patch.object(tasks, "get_db_session", fake_session)
+    mocker.patch.object(tasks.services, "get_recent_post_urls", AsyncMock(return_value=urls))
+    mocker.patch.object(tasks.FinancialParser, "iter_post_data", iter_post_data)
+    upsert = mocker.patch("src.scrap.sink.bulk_upsert_posts", AsyncMock(return_value=UpsertResultSchema(updated=1, skipped=1)))
+
+    result = await tasks.revisit_recent(days=2, limit=10)
+
+    assert seen == {"cache": None, "known_urls": None, "links": ["/content/a", "/content/b"]}
+    assert upsert.call_args.kwargs["on_conflict"] == "update"
+    assert result == {"status": "done", "revisited": 3, "revised": 1, "unchanged": 1, "failed": 0}
@@ -0,0 +1,46 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from celery import Celery
+from src.scrap.worker_loop import AsyncTask, get_worker_loop
+
+
+app = Celery(set_as_current=False)
+
+
+@app.task(base=AsyncTask)
+async def sleepy(delay):
+    await asyncio.sleep(delay)
+    return id(asyncio.get_running_loop())
+
+
+@app.task(base=AsyncTask)
+async def meet(arrived, parties):
+    """Wait until `parties` tasks have arrived, which only happens if they overlap."""
+    arrived.append(asyncio.current_task())
+
+    async with asyncio.timeout(10):
+        while len(arrived) < parties:
+            await asyncio.sleep(0.01)
+
+    return id(asyncio.get_running_loop())
+
+
+@app.task(base=AsyncTask)
+def plain(a, b):
+    return a + b
+
+
+def test_async_tasks_share_one_persistent_loop():
+    arrived = []
+
+    with ThreadPoolExecutor(4) as threads:
+        # run one at a time, the first task would time out waiting for the others
+        loops = list(threads.map(lambda _: meet.apply(args=(arrived, 4)).get(), range(4)))
+
+    assert len(arrived) == 4
+    assert set(loops) == {id(get_worker_loop().loop)}
+    assert sleepy(0) == loops[0]
+
+
+def test_sync_tasks_run_unchanged():
+    assert plain.apply(args=(1, 2)).get() == 3